@@ -3,7 +3,10 @@
 import logging
 import shutil
 import subprocess
+import tempfile
+import threading
 from pathlib import Path
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +58,50 @@ class ClaudeCLIService:
         except subprocess.TimeoutExpired:
             raise RuntimeError(f"Claude CLI timed out after {self.timeout}s")
 
+    def stream(self, prompt: str) -> Iterator[str]:
+        """Stream text generation. Yields output lines as they arrive."""
+        # stderr goes to a file rather than a pipe: nobody reads it until
+        # stdout closes, and a full stderr pipe would block claude forever
+        with tempfile.TemporaryFile("w+") as stderr_file:
+            try:
+                proc = subprocess.Popen(
+                    [self._claude, "-p", prompt],
+                    cwd=self.cwd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    text=True,
+                )
+            except FileNotFoundError:
+                raise RuntimeError("Claude CLI not found. Install with: npm install -g @anthropic-ai/claude-code")
+
+            timed_out = threading.Event()
+
+            def kill_on_timeout():
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(self.timeout, kill_on_timeout)
+            timer.start()
+            try:
+                yield from proc.stdout
+                proc.wait()
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    # Consumer stopped early - don't leave claude running
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+
+        if timed_out.is_set():
+            raise RuntimeError(f"Claude CLI timed out after {self.timeout}s")
+        if proc.returncode != 0:
+            logger.error(f"Claude CLI failed: {stderr}")
+            raise RuntimeError(f"Claude CLI failed: {stderr}")
+
     def run_command(self, command: str) -> str:
         """
         Run a slash command (e.g., "/triage").
@@ -35,13 +35,13 @@ class FileJournalStore:
         """Append a section to an existing journal entry."""
         path = self._path_for_date(target_date)
 
-        if path.exists():
-            existing = path.read_text()
-            new_content = f"{existing}\n\n---\n\n## {section_header}\n\n{content}"
-        else:
-            new_content = f"## {section_header}\n\n{content}"
-
-        path.write_text(new_content)
+        # Append mode starts at end-of-file, so tell() says whether the
+        # entry already has content - no need to read it back
+        with open(path, "a") as f:
+            if f.tell():
+                f.write(f"\n\n---\n\n## {section_header}\n\n{content}")
+            else:
+                f.write(f"## {section_header}\n\n{content}")
 
     def exists(self, target_date: date) -> bool:
         """Check if a journal entry exists for a date."""
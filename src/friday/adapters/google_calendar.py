@@ -143,39 +143,7 @@ class GoogleCalendarAdapter:
                 .execute()
             )
 
-            for item in result.get("items", []):
-                # Skip events the user has declined
-                attendees = item.get("attendees", [])
-                if any(a.get("self") and a.get("responseStatus") == "declined" for a in attendees):
-                    continue
-
-                start_raw = item.get("start", {})
-                end_raw = item.get("end", {})
-
-                if "date" in start_raw:
-                    # All-day event — attach timezone so sorting with timed events works
-                    tz = ZoneInfo(self.timezone)
-                    start_dt = datetime.fromisoformat(start_raw["date"]).replace(tzinfo=tz)
-                    end_dt = datetime.fromisoformat(end_raw["date"]).replace(tzinfo=tz) if "date" in end_raw else None
-                    all_day = True
-                elif "dateTime" in start_raw:
-                    start_dt = datetime.fromisoformat(start_raw["dateTime"])
-                    end_dt = datetime.fromisoformat(end_raw["dateTime"]) if "dateTime" in end_raw else None
-                    all_day = False
-                else:
-                    continue
-
-                events.append(
-                    Event(
-                        title=item.get("summary", "Untitled"),
-                        start=start_dt,
-                        end=end_dt,
-                        location=item.get("location", ""),
-                        calendar=self.label,
-                        all_day=all_day,
-                        source="google_calendar",
-                    )
-                )
+            events.extend(_parse_events(result.get("items", []), self.label, self.timezone))
 
         return events
 
@@ -190,3 +158,42 @@ class GoogleCalendarAdapter:
             (entry.get("accessRole", ""), entry.get("summary", ""))
             for entry in result.get("items", [])
         ]
+
+
+def _parse_events(items: list[dict], label: str, timezone: str) -> list[Event]:
+    """Convert Calendar API event items to Events, skipping declined ones."""
+    events = []
+    for item in items:
+        # Skip events the user has declined
+        attendees = item.get("attendees", [])
+        if any(a.get("self") and a.get("responseStatus") == "declined" for a in attendees):
+            continue
+
+        start_raw = item.get("start", {})
+        end_raw = item.get("end", {})
+
+        if "date" in start_raw:
+            # All-day event — attach timezone so sorting with timed events works
+            tz = ZoneInfo(timezone)
+            start_dt = datetime.fromisoformat(start_raw["date"]).replace(tzinfo=tz)
+            end_dt = datetime.fromisoformat(end_raw["date"]).replace(tzinfo=tz) if "date" in end_raw else None
+            all_day = True
+        elif "dateTime" in start_raw:
+            start_dt = datetime.fromisoformat(start_raw["dateTime"])
+            end_dt = datetime.fromisoformat(end_raw["dateTime"]) if "dateTime" in end_raw else None
+            all_day = False
+        else:
+            continue
+
+        events.append(
+            Event(
+                title=item.get("summary", "Untitled"),
+                start=start_dt,
+                end=end_dt,
+                location=item.get("location", ""),
+                calendar=label,
+                all_day=all_day,
+                source="google_calendar",
+            )
+        )
+    return events
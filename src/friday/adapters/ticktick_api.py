@@ -1,18 +1,37 @@
 """TickTick API adapter - HTTP client for task fetching."""
 
+import threading
 import time
 import webbrowser
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from friday.config import Config, Tokens, load_config
-from friday.core.tasks import Task
+from friday.config import Config, Tokens, load_config, reload_config
+from friday.core.tasks import Task, filter_actionable, sort_by_priority
 
 API_BASE = "https://api.ticktick.com/open/v1"
 OAUTH_AUTHORIZE_URL = "https://ticktick.com/oauth/authorize"
 OAUTH_TOKEN_URL = "https://ticktick.com/oauth/token"
 REDIRECT_URI = "http://localhost:8080/callback"
 
+# Refreshing invalidates the old refresh token, so concurrent adapters must
+# not refresh at the same time
+_refresh_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Shared keep-alive session, sized for concurrent bot commands.
+
+    Adapters are created per command, so a process-wide session lets them
+    reuse open TLS connections to TickTick instead of handshaking each time.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return session
+
 
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
@@ -31,7 +50,7 @@ class TickTickAdapter:
     def __init__(self, config: Config | None = None, tokens: Tokens | None = None):
         self.config = config or load_config()
         self.tokens = tokens or Tokens.load()
-        self._session = requests.Session()
+        self._session = _http_session()
         self._project_names: dict[str, str] = {}
 
     def _ensure_valid_token(self) -> None:
@@ -39,10 +58,22 @@ class TickTickAdapter:
         if not self.tokens.access_token:
             raise AuthenticationError("No access token. Run 'friday auth' first.")
 
-        # Refresh if expiring within 5 minutes
-        if self.tokens.expires_at and time.time() >= self.tokens.expires_at - 300:
+        if not self._token_expiring(self.tokens):
+            return
+
+        with _refresh_lock:
+            # Another adapter may have refreshed while we waited for the lock
+            saved = Tokens.load()
+            if saved.access_token and not self._token_expiring(saved):
+                self.tokens = saved
+                return
             self._refresh_token()
 
+    @staticmethod
+    def _token_expiring(tokens: Tokens) -> bool:
+        """True if the access token expires within 5 minutes."""
+        return bool(tokens.expires_at) and time.time() >= tokens.expires_at - 300
+
     def _refresh_token(self) -> None:
         """Refresh the access token."""
         if not self.tokens.refresh_token:
@@ -106,9 +137,23 @@ class TickTickAdapter:
     def fetch_all(self) -> list[Task]:
         """Fetch all tasks from all projects."""
         self._load_project_names()
+        return self._fetch_projects(self._project_names.items())
+
+    def fetch_lists(self, names: list[str]) -> list[Task]:
+        """Fetch tasks from the named projects only."""
+        self._load_project_names()
+        wanted = set(names)
+        return self._fetch_projects(
+            (project_id, project_name)
+            for project_id, project_name in self._project_names.items()
+            if project_name in wanted
+        )
+
+    def _fetch_projects(self, projects) -> list[Task]:
+        """Fetch tasks for (project_id, project_name) pairs."""
         tasks = []
 
-        for project_id, project_name in self._project_names.items():
+        for project_id, project_name in projects:
             project_tasks = self._get_project_tasks(project_id)
             for task_data in project_tasks:
                 tasks.append(Task.from_api(task_data, project_name))
@@ -120,10 +165,14 @@ class TickTickAdapter:
         return self.fetch_all()
 
     def get_priority_tasks(self) -> list[Task]:
-        """Get actionable tasks sorted by priority."""
-        from friday.core.tasks import filter_actionable, sort_by_priority
-
-        all_tasks = self.fetch_all()
+        """Get actionable tasks sorted by priority.
+
+        When PRIORITY_TASK_LISTS is configured only those projects are fetched.
+        """
+        if self.config.priority_task_lists:
+            all_tasks = self.fetch_lists(self.config.priority_task_lists)
+        else:
+            all_tasks = self.fetch_all()
         actionable = filter_actionable(all_tasks)
         return sort_by_priority(actionable)
 
@@ -144,7 +193,8 @@ class TickTickAdapter:
 
 def authorize(config: Config | None = None) -> Tokens:
     """Run OAuth authorization flow."""
-    config = config or load_config()
+    # Credentials were likely just edited - bypass the config cache
+    config = config or reload_config()
 
     if not config.ticktick_client_id or not config.ticktick_client_secret:
         raise AuthenticationError(
@@ -170,7 +220,7 @@ def authorize(config: Config | None = None) -> Tokens:
         raise AuthenticationError("No code provided")
 
     print("Exchanging code for tokens...")
-    resp = requests.post(
+    resp = _http_session().post(
         OAUTH_TOKEN_URL,
         data={
             "client_id": config.ticktick_client_id,
@@ -232,7 +232,7 @@ def startweek_fixture():
     from dataclasses import asdict
     from datetime import datetime, timedelta
 
-    from .core.tasks import filter_notes
+    from .core.tasks import categorize_tasks, filter_notes
 
     config = load_config()
     today = date.today()
@@ -312,9 +312,9 @@ def startweek_fixture():
         if not t.is_note
         and ((t.due_date and t.due_date <= end_of_saturday) or t.priority >= 3)
     ]
-    work_tasks = [t for t in week_tasks if t.project_name in config.work_task_lists]
-    personal_tasks = [t for t in week_tasks if t.project_name in config.personal_task_lists]
-    other_tasks = [t for t in week_tasks if t.project_name not in config.work_task_lists and t.project_name not in config.personal_task_lists]
+    work_tasks, personal_tasks, other_tasks = categorize_tasks(
+        week_tasks, config.work_task_lists, config.personal_task_lists
+    )
     notes = filter_notes(all_tasks, urgent_days=days_remaining)
 
     fixture["processed"]["week_tasks"] = [serialize_task(t) for t in week_tasks]
@@ -324,7 +324,7 @@ def startweek_fixture():
     fixture["processed"]["notes"] = [serialize_task(t) for t in notes]
 
     # --- Prompt ---
-    fixture["prompt"] = compile_week()
+    fixture["prompt"] = compile_week(config, today)
 
     # Save
     fixtures_dir = Path(__file__).resolve().parent.parent.parent / "tests" / "fixtures"
@@ -1,10 +1,13 @@
 """Configuration management for Friday."""
 
+import copy
 import json
 import logging
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,7 @@ class Config:
     work_hours: str = "09:00-17:00"
     work_task_lists: list[str] = field(default_factory=list)
     personal_task_lists: list[str] = field(default_factory=list)
+    priority_task_lists: list[str] = field(default_factory=list)
     deep_work_hours: list[str] = field(default_factory=lambda: ["09:00-11:00", "14:00-16:00"])
     daily_journal_dir: str = ""
     weekly_review_day: str = "Sunday"
@@ -56,9 +60,16 @@ class Tokens:
     access_token: str = ""
     refresh_token: str = ""
     expires_at: int = 0
+    # Field values as last read from or written to disk
+    _persisted: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _values(self) -> tuple[str, str, int]:
+        return (self.access_token, self.refresh_token, self.expires_at)
 
     def save(self) -> None:
-        """Save tokens to file."""
+        """Save tokens to file. Skipped when nothing changed since load/save."""
+        if self._values() == self._persisted:
+            return
         TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
         TOKEN_FILE.write_text(
             json.dumps(
@@ -70,31 +81,97 @@ class Tokens:
             )
         )
         TOKEN_FILE.chmod(0o600)
+        self._persisted = self._values()
 
     @classmethod
     def load(cls) -> "Tokens":
-        """Load tokens from file."""
-        if not TOKEN_FILE.exists():
-            return cls()
+        """Load tokens from file.
+
+        The file is only parsed again when it changes on disk. Each call still
+        returns a new Tokens, since adapters mutate theirs on refresh.
+        """
         try:
-            data = json.loads(TOKEN_FILE.read_text())
-            return cls(
-                access_token=data.get("access_token", ""),
-                refresh_token=data.get("refresh_token", ""),
-                expires_at=data.get("expires_at", 0),
-            )
-        except (json.JSONDecodeError, KeyError):
+            stat = TOKEN_FILE.stat()
+        except FileNotFoundError:
+            return cls()
+        values = _read_token_file(TOKEN_FILE, stat.st_mtime_ns, stat.st_size)
+        if values is None:
             return cls()
+        tokens = cls(*values)
+        tokens._persisted = values
+        return tokens
 
 
-def load_config() -> Config:
-    """Load configuration from friday.conf file."""
-    config = Config()
+@lru_cache(maxsize=1)
+def _read_token_file(path: Path, mtime_ns: int, size: int) -> tuple[str, str, int] | None:
+    """Parse a token file. mtime_ns and size only serve as cache keys."""
+    try:
+        data = json.loads(path.read_text())
+        return (
+            data.get("access_token", ""),
+            data.get("refresh_token", ""),
+            data.get("expires_at", 0),
+        )
+    except (json.JSONDecodeError, KeyError):
+        return None
+
+
+def load_config(source: str | Path | TextIO | None = None) -> Config:
+    """Load configuration from friday.conf file.
+
+    source may be another config path or an open text stream; it defaults to
+    CONFIG_FILE. Files are cached until they change on disk, so callers can
+    invoke this freely (e.g. once per Telegram message). Streams are parsed
+    on every call. Each call returns its own Config, so callers may modify it.
+    """
+    if source is None:
+        source = CONFIG_FILE
+    if not isinstance(source, (str, Path)):
+        return _parse_config(source.read())
+
+    path = Path(source)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return Config()
+    # The cached Config has mutable list fields; hand out a copy
+    return copy.deepcopy(_parse_config_file(path, stat.st_mtime_ns, stat.st_size))
+
 
-    if not CONFIG_FILE.exists():
-        return config
+def clear_config_cache() -> None:
+    """Forget every parsed config file."""
+    _parse_config_file.cache_clear()
+
+
+def reload_config() -> Config:
+    """Drop any cached configuration and load it again from disk."""
+    clear_config_cache()
+    return load_config()
+
+
+def journal_dir_for(config: Config) -> Path:
+    """Resolve the daily journal directory for a config."""
+    return _resolve_journal_dir(config.daily_journal_dir)
+
+
+@lru_cache(maxsize=8)
+def _resolve_journal_dir(daily_journal_dir: str) -> Path:
+    if daily_journal_dir:
+        return Path(daily_journal_dir).expanduser()
+    return FRIDAY_HOME / "journal" / "daily"
+
+
+@lru_cache(maxsize=4)
+def _parse_config_file(path: Path, mtime_ns: int, size: int) -> Config:
+    """Parse a config file. mtime_ns and size only serve as cache keys."""
+    return _parse_config(path.read_text())
+
+
+def _parse_config(text: str) -> Config:
+    """Parse friday.conf contents."""
+    config = Config()
 
-    for line in CONFIG_FILE.read_text().splitlines():
+    for line in text.splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
             continue
@@ -167,6 +244,8 @@ def load_config() -> Config:
                 config.work_task_lists = [c.strip() for c in value.split(",") if c.strip()]
             case "personal_task_lists":
                 config.personal_task_lists = [c.strip() for c in value.split(",") if c.strip()]
+            case "priority_task_lists":
+                config.priority_task_lists = [c.strip() for c in value.split(",") if c.strip()]
             case "deep_work_hours":
                 config.deep_work_hours = [h.strip() for h in value.split(",") if h.strip()]
             case "daily_journal_dir":
@@ -2,8 +2,9 @@
 
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import partial
 
-from .tasks import Task, filter_actionable, categorize_tasks, sort_by_priority
+from .tasks import Task, classify_tasks, sort_by_priority
 from .calendar import Event, TimeSlot, find_free_slots
 
 
@@ -40,16 +41,13 @@ def assemble_briefing(
     as_of = as_of or datetime.now()
     today = as_of.date()
 
-    # Filter to actionable tasks
-    actionable = filter_actionable(tasks, urgent_days, today)
-
-    # Categorize by work/personal
-    work, personal, other = categorize_tasks(actionable, work_task_lists, personal_task_lists)
+    # Filter to actionable tasks and categorize by work/personal in one pass
+    buckets = classify_tasks(tasks, work_task_lists, personal_task_lists, urgent_days, today)
 
     # Sort each category by priority
-    work = sort_by_priority(work, today)
-    personal = sort_by_priority(personal, today)
-    other = sort_by_priority(other, today)
+    work = sort_by_priority(buckets.work, today)
+    personal = sort_by_priority(buckets.personal, today)
+    other = sort_by_priority(buckets.other, today)
 
     # Find free time slots
     free_slots = find_free_slots(
@@ -80,10 +78,11 @@ def format_task_line(task: Task, as_of: date | None = None) -> str:
     Pure function - no I/O.
     """
     as_of = as_of or date.today()
-    days = task.days_until_due(as_of)
+    due_date = task.due_date
 
     urgency = ""
-    if days is not None:
+    if due_date is not None:
+        days = (due_date - as_of).days
         if days < 0:
             urgency = f"OVERDUE by {-days}d"
         elif days == 0:
@@ -95,6 +94,25 @@ def format_task_line(task: Task, as_of: date | None = None) -> str:
     return f"- [{quadrant}] {task.title} ({urgency}, project: {task.project_name})"
 
 
+def format_note_line(note: Task, as_of: date | None = None) -> str:
+    """
+    Format a dated note (reminder) for display in briefing.
+
+    Pure function - no I/O.
+    """
+    as_of = as_of or date.today()
+    days = (note.due_date - as_of).days
+
+    if days < 0:
+        when = f"since {-days}d ago"
+    elif days == 0:
+        when = "today"
+    else:
+        when = f"in {days}d"
+
+    return f"- {note.title} ({when}, project: {note.project_name})"
+
+
 def format_event_line(event: Event) -> str:
     """
     Format a single event for display.
@@ -118,9 +136,10 @@ def format_briefing_sections(data: BriefingData) -> dict[str, str]:
     Returns dict with keys: tasks, calendar, free_slots, time_context
     """
     # Format tasks by category
-    work_md = "\n".join(format_task_line(t, data.date) for t in data.work_tasks) or "None"
-    personal_md = "\n".join(format_task_line(t, data.date) for t in data.personal_tasks) or "None"
-    other_md = "\n".join(format_task_line(t, data.date) for t in data.other_tasks) or "None"
+    format_task = partial(format_task_line, as_of=data.date)
+    work_md = "\n".join(map(format_task, data.work_tasks)) or "None"
+    personal_md = "\n".join(map(format_task, data.personal_tasks)) or "None"
+    other_md = "\n".join(map(format_task, data.other_tasks)) or "None"
 
     tasks_md = f"""### Work Tasks
 {work_md}
@@ -132,7 +151,7 @@ def format_briefing_sections(data: BriefingData) -> dict[str, str]:
 {other_md}"""
 
     # Format calendar
-    calendar_md = "\n".join(format_event_line(e) for e in data.events) or "No events today."
+    calendar_md = "\n".join(map(format_event_line, data.events)) or "No events today."
 
     # Format free slots
     free_slots_md = "\n".join(f"- {slot.format()}" for slot in data.free_slots) or "No free slots today."
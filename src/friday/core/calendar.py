@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     """A calendar event."""
 
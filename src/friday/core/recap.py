@@ -3,10 +3,15 @@
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache
 
+# Body sections run until the next heading or the end of the recap
+_REFLECTION_RE = re.compile(r"## Reflection\s*\n(.*?)(?=## |$)", re.DOTALL)
+_TOMORROW_FOCUS_RE = re.compile(r"## Tomorrow's Focus\s*\n(.*?)(?=## |$)", re.DOTALL)
 
-class RecapMode(Enum):
+
+class RecapMode(StrEnum):
     """Recap mode based on available context."""
 
     FULL = "full"  # Had briefing, compare planned vs actual
@@ -14,7 +19,7 @@ class RecapMode(Enum):
     FREEFORM = "freeform"  # Minimal data, open reflection
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Recap:
     """Daily recap entry."""
 
@@ -37,116 +42,44 @@ class Recap:
 
     def to_markdown(self) -> str:
         """Serialize to YAML frontmatter + markdown."""
-        lines = ["---"]
-        lines.append(f"date: {self.date.isoformat()}")
-        lines.append(f"mode: {self.mode.value}")
+        lines = ["---", f"date: {self.date.isoformat()}", f"mode: {self.mode}"]
 
         if self.planned_tasks is not None:
             lines.append(f"planned_tasks: {self.planned_tasks}")
         if self.completed_tasks is not None:
             lines.append(f"completed_tasks: {self.completed_tasks}")
 
-        if self.wins:
-            lines.append("wins:")
-            for win in self.wins:
-                lines.append(f'  - "{win}"')
-
-        if self.blockers:
-            lines.append("blockers:")
-            for blocker in self.blockers:
-                lines.append(f'  - "{blocker}"')
-
-        if self.tags:
-            lines.append("tags:")
-            for tag in self.tags:
-                lines.append(f'  - "{tag}"')
+        for key, items in (("wins", self.wins), ("blockers", self.blockers), ("tags", self.tags)):
+            if items:
+                lines.append(f"{key}:")
+                lines.extend(f'  - "{item}"' for item in items)
 
         if self.energy:
             lines.append(f'energy: "{self.energy}"')
 
-        lines.append("---")
-        lines.append("")
+        lines.extend(("---", ""))
 
         if self.reflection:
-            lines.append("## Reflection")
-            lines.append("")
-            lines.append(self.reflection)
-            lines.append("")
+            lines.extend(("## Reflection", "", self.reflection, ""))
 
         if self.tomorrow_focus:
-            lines.append("## Tomorrow's Focus")
-            lines.append("")
-            lines.append(self.tomorrow_focus)
-            lines.append("")
+            lines.extend(("## Tomorrow's Focus", "", self.tomorrow_focus, ""))
 
         return "\n".join(lines)
 
     @classmethod
     def from_markdown(cls, content: str) -> "Recap":
         """Parse from YAML frontmatter + markdown."""
-        # Split frontmatter from body
-        if not content.startswith("---"):
-            raise ValueError("Invalid recap format: missing frontmatter")
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            raise ValueError("Invalid recap format: incomplete frontmatter")
+        fields, reflection, tomorrow_focus = _parse_recap(content)
+        data = dict(fields)
 
-        frontmatter = parts[1].strip()
-        body = parts[2].strip()
-
-        # Parse frontmatter (simple YAML parsing)
-        data: dict = {}
-        current_list: list | None = None
-        current_key: str | None = None
-
-        for line in frontmatter.splitlines():
-            line = line.rstrip()
-            if not line:
-                continue
-
-            # Check for list item
-            if line.startswith("  - "):
-                value = line[4:].strip().strip('"').strip("'")
-                if current_key and current_list is not None:
-                    current_list.append(value)
-                continue
-
-            # Check for key: value
-            if ":" in line:
-                key, _, value = line.partition(":")
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-
-                if value == "":
-                    # Start of a list
-                    current_key = key
-                    current_list = []
-                    data[key] = current_list
-                else:
-                    data[key] = value
-                    current_key = None
-                    current_list = None
-
-        # Parse body sections
-        reflection = ""
-        tomorrow_focus = ""
-
-        reflection_match = re.search(r"## Reflection\s*\n(.*?)(?=## |$)", body, re.DOTALL)
-        if reflection_match:
-            reflection = reflection_match.group(1).strip()
-
-        tomorrow_match = re.search(r"## Tomorrow's Focus\s*\n(.*?)(?=## |$)", body, re.DOTALL)
-        if tomorrow_match:
-            tomorrow_focus = tomorrow_match.group(1).strip()
-
-        # Build recap object
+        # Build recap object; lists are copied so callers can't alter the cache
         return cls(
-            date=date.fromisoformat(data.get("date", date.today().isoformat())),
+            date=date.fromisoformat(data["date"]) if "date" in data else date.today(),
             mode=RecapMode(data.get("mode", "freeform")),
-            wins=data.get("wins", []),
-            blockers=data.get("blockers", []),
-            tags=data.get("tags", []),
+            wins=list(data.get("wins", ())),
+            blockers=list(data.get("blockers", ())),
+            tags=list(data.get("tags", ())),
             energy=data.get("energy"),
             planned_tasks=int(data["planned_tasks"]) if "planned_tasks" in data else None,
             completed_tasks=int(data["completed_tasks"]) if "completed_tasks" in data else None,
@@ -155,6 +88,99 @@ class Recap:
         )
 
 
+@lru_cache(maxsize=256)
+def _parse_recap(content: str) -> tuple[tuple[tuple[str, str | tuple[str, ...]], ...], str, str]:
+    """Parse recap markdown into (frontmatter items, reflection, tomorrow focus).
+
+    Cached on the content, so everything returned is immutable.
+    """
+    frontmatter, body = _split_frontmatter(content)
+    data = _parse_frontmatter(frontmatter)
+    fields = tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in data.items()
+    )
+
+    # Parse body sections
+    reflection = ""
+    tomorrow_focus = ""
+
+    reflection_match = _REFLECTION_RE.search(body)
+    if reflection_match:
+        reflection = reflection_match.group(1).strip()
+
+    tomorrow_match = _TOMORROW_FOCUS_RE.search(body)
+    if tomorrow_match:
+        tomorrow_focus = tomorrow_match.group(1).strip()
+
+    return fields, reflection, tomorrow_focus
+
+
+def _split_frontmatter(content: str) -> tuple[str, str]:
+    """Split a recap into (frontmatter, body) on whole '---' lines.
+
+    Only a line that is exactly '---' closes the frontmatter, so a win or
+    blocker containing '---' does not end it early.
+    """
+    if not content.startswith("---"):
+        raise ValueError("Invalid recap format: missing frontmatter")
+
+    start = content.find("\n") + 1
+    if start == 0:
+        raise ValueError("Invalid recap format: incomplete frontmatter")
+
+    pos = start - 1
+    while True:
+        pos = content.find("\n---", pos)
+        if pos == -1:
+            raise ValueError("Invalid recap format: incomplete frontmatter")
+        after = pos + 4
+        if after == len(content) or content[after] in "\r\n":
+            return content[start:pos].strip(), content[after:].strip()
+        pos = after
+
+
+def _parse_frontmatter(text: str) -> dict:
+    """Parse recap frontmatter: `key: value` scalars and `  - item` lists."""
+    data: dict = {}
+    current_list: list | None = None
+
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line:
+            continue
+
+        # Check for list item
+        if line.startswith("  - "):
+            if current_list is not None:
+                current_list.append(line[4:].strip().strip('"').strip("'"))
+            continue
+
+        # Check for key: value
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip().strip('"').strip("'")
+
+        if value == "":
+            # Start of a list
+            current_list = []
+            data[key] = current_list
+        else:
+            data[key] = value
+            current_list = None
+
+    return data
+
+
+# Indexed by [has_briefing][has_task_data]; a briefing always means FULL
+_MODE_TABLE = (
+    (RecapMode.FREEFORM, RecapMode.TASKS_ONLY),
+    (RecapMode.FULL, RecapMode.FULL),
+)
+
+
 def determine_recap_mode(
     has_briefing: bool,
     has_task_data: bool,
@@ -164,9 +190,4 @@ def determine_recap_mode(
 
     Pure function - no I/O. Caller must check for briefing/task availability.
     """
-    if has_briefing:
-        return RecapMode.FULL
-    elif has_task_data:
-        return RecapMode.TASKS_ONLY
-    else:
-        return RecapMode.FREEFORM
+    return _MODE_TABLE[bool(has_briefing)][bool(has_task_data)]
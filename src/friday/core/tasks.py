@@ -1,10 +1,14 @@
 """Pure task domain logic - no I/O dependencies."""
 
+import sys
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 
+# Indexed by quadrant number
+_QUADRANT_LABELS = ("", "Do", "Schedule", "Delegate", "Delete")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Task:
     """A task with Eisenhower matrix classification."""
 
@@ -41,22 +45,12 @@ class Task:
         Q3: Urgent + Not Important (Delegate)
         Q4: Not Urgent + Not Important (Delete)
         """
-        important = self.is_important()
-        urgent = self.is_urgent(urgent_days, as_of)
-
-        if urgent and important:
-            return 1
-        elif not urgent and important:
-            return 2
-        elif urgent and not important:
-            return 3
-        else:
-            return 4
+        # Not important moves down two quadrants, not urgent moves down one
+        return 1 + 2 * (not self.is_important()) + (not self.is_urgent(urgent_days, as_of))
 
     def quadrant_label(self, urgent_days: int = 3, as_of: date | None = None) -> str:
         """Human-readable quadrant label."""
-        labels = {1: "Do", 2: "Schedule", 3: "Delegate", 4: "Delete"}
-        return labels[self.quadrant(urgent_days, as_of)]
+        return _QUADRANT_LABELS[self.quadrant(urgent_days, as_of)]
 
     def days_until_due(self, as_of: date | None = None) -> int | None:
         """Days until due date (negative if overdue)."""
@@ -70,18 +64,25 @@ class Task:
         """Create Task from TickTick API response."""
         due = None
         if data.get("dueDate"):
-            due = date.fromisoformat(data["dueDate"].split("T")[0])
+            due = date.fromisoformat(data["dueDate"][:10])
         return cls(
             id=data["id"],
             title=data["title"],
             priority=data.get("priority", 0),
             due_date=due,
             project_id=data.get("projectId", ""),
-            project_name=project_name,
+            # Few distinct project names recur across every task; interning
+            # lets the set lookups in categorize_tasks match by identity
+            project_name=sys.intern(project_name),
             kind=data.get("kind", "TEXT") or "TEXT",
         )
 
 
+def _urgent_cutoff(urgent_days: int, as_of: date | None) -> date:
+    """Latest due date that still counts as urgent."""
+    return (as_of or date.today()) + timedelta(days=urgent_days)
+
+
 def filter_actionable(
     tasks: list[Task],
     urgent_days: int = 3,
@@ -92,12 +93,13 @@ def filter_actionable(
 
     Pure function - no I/O.
     """
-    as_of = as_of or date.today()
+    # Q1 implies urgent, so urgency alone decides actionability. Comparing
+    # against a precomputed cutoff avoids per-task date arithmetic.
+    cutoff = _urgent_cutoff(urgent_days, as_of)
     return [
         t
         for t in tasks
-        if not t.is_note
-        and (t.is_urgent(urgent_days, as_of) or t.quadrant(urgent_days, as_of) == 1)
+        if not t.is_note and t.due_date and t.due_date <= cutoff
     ]
 
 
@@ -109,32 +111,86 @@ def categorize_tasks(
     """
     Split tasks into work, personal, and other categories.
 
+    A project listed as both work and personal lands in both.
+
     Returns: (work_tasks, personal_tasks, other_tasks)
     Pure function - no I/O.
     """
-    work = [t for t in tasks if t.project_name in work_lists]
-    personal = [t for t in tasks if t.project_name in personal_lists]
-    other = [
-        t for t in tasks if t.project_name not in work_lists and t.project_name not in personal_lists
-    ]
+    work_set = frozenset(map(sys.intern, work_lists))
+    personal_set = frozenset(map(sys.intern, personal_lists))
+    work: list[Task] = []
+    personal: list[Task] = []
+    other: list[Task] = []
+    for t in tasks:
+        in_work = t.project_name in work_set
+        in_personal = t.project_name in personal_set
+        if in_work:
+            work.append(t)
+        if in_personal:
+            personal.append(t)
+        if not (in_work or in_personal):
+            other.append(t)
     return work, personal, other
 
 
+@dataclass
+class TaskBuckets:
+    """Due-soon tasks split by project category, plus due-soon notes."""
+
+    work: list[Task]
+    personal: list[Task]
+    other: list[Task]
+    notes: list[Task]
+
+
+def classify_tasks(
+    tasks: list[Task],
+    work_lists: list[str],
+    personal_lists: list[str],
+    urgent_days: int = 3,
+    as_of: date | None = None,
+) -> TaskBuckets:
+    """
+    Single-pass equivalent of filter_actionable + categorize_tasks + filter_notes.
+
+    Pure function - no I/O.
+    """
+    cutoff = _urgent_cutoff(urgent_days, as_of)
+    work_set = frozenset(map(sys.intern, work_lists))
+    personal_set = frozenset(map(sys.intern, personal_lists))
+    buckets = TaskBuckets(work=[], personal=[], other=[], notes=[])
+    for t in tasks:
+        # Q1 implies urgent, so urgency alone decides actionability
+        if not t.due_date or t.due_date > cutoff:
+            continue
+        if t.is_note:
+            buckets.notes.append(t)
+            continue
+        in_work = t.project_name in work_set
+        in_personal = t.project_name in personal_set
+        if in_work:
+            buckets.work.append(t)
+        if in_personal:
+            buckets.personal.append(t)
+        if not (in_work or in_personal):
+            buckets.other.append(t)
+    return buckets
+
+
 def sort_by_priority(tasks: list[Task], as_of: date | None = None) -> list[Task]:
     """
     Sort tasks by priority (descending) then due date (ascending).
 
     Pure function - no I/O.
     """
-    as_of = as_of or date.today()
+    # Ordering by due date is the same as ordering by days until due, so
+    # as_of does not affect the result; it is kept for API compatibility.
+    return sorted(tasks, key=_priority_sort_key)
 
-    def sort_key(t: Task) -> tuple[int, int]:
-        # Negative priority for descending sort
-        # Days until due (use large number for no due date)
-        days = t.days_until_due(as_of)
-        return (-t.priority, days if days is not None else 9999)
 
-    return sorted(tasks, key=sort_key)
+def _priority_sort_key(t: Task) -> tuple[int, date]:
+    # Negative priority for descending sort; undated tasks sort last
+    return (-t.priority, t.due_date or date.max)
 
 
 def filter_notes(
@@ -143,11 +199,11 @@ def filter_notes(
     as_of: date | None = None,
 ) -> list[Task]:
     """Filter to notes that are due soon (time-relevant reminders)."""
-    as_of = as_of or date.today()
+    cutoff = _urgent_cutoff(urgent_days, as_of)
     return [
         t
         for t in tasks
-        if t.is_note and t.due_date and (t.due_date - as_of).days <= urgent_days
+        if t.is_note and t.due_date and t.due_date <= cutoff
     ]
 
 
@@ -158,5 +214,6 @@ def filter_overdue(tasks: list[Task], as_of: date | None = None) -> list[Task]:
 
 
 def filter_by_project(tasks: list[Task], project_name: str) -> list[Task]:
-    """Filter tasks to a specific project."""
-    return [t for t in tasks if t.project_name.lower() == project_name.lower()]
+    """Filter tasks to a specific project, ignoring case."""
+    key = project_name.casefold()
+    return [t for t in tasks if t.project_name.casefold() == key]
@@ -1,8 +1,8 @@
 """Friday Telegram Bot."""
 
+import asyncio
 import logging
 from datetime import date
-from pathlib import Path
 
 from telegram import BotCommand, Update, Bot
 from telegram.ext import (
@@ -15,8 +15,9 @@ from telegram.ext import (
 )
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from .config import load_config, FRIDAY_HOME
+from .config import journal_dir_for, load_config
 from .telegram_handlers import (
+    journal_has_recap,
     start_handler,
     help_handler,
     briefing_handler,
@@ -37,11 +38,15 @@ from .telegram_handlers import (
     recap_cancel_handler,
 )
 from .telegram_states import RecapStates
+from .workflows import generate_briefing, generate_weekly_plan, generate_weekly_review
 
 from .telegram_format import send_markdown
 
 logger = logging.getLogger(__name__)
 
+# Cap on in-flight sends when fanning out to several chats
+BROADCAST_CONCURRENCY = 5
+
 
 class AuthFilter(filters.BaseFilter):
     """Filter to only allow authorized users."""
@@ -70,8 +75,16 @@ def create_application(config=None) -> Application:
             "Get a token from @BotFather on Telegram and add it to friday.conf"
         )
 
-    # Build application
-    app = Application.builder().token(config.telegram_bot_token).build()
+    # Build application. Updates are handled concurrently so a slow
+    # /morning doesn't hold up /tasks; the HTTP pool is sized to match.
+    app = (
+        Application.builder()
+        .token(config.telegram_bot_token)
+        .concurrent_updates(32)
+        .connection_pool_size(32)
+        .pool_timeout(10)
+        .build()
+    )
 
     # Create auth filter
     auth_filter = AuthFilter(config.telegram_allowed_users)
@@ -228,56 +241,68 @@ def setup_scheduler(app: Application, config=None) -> AsyncIOScheduler:
     return scheduler
 
 
+async def _broadcast(user_ids: list[int], send, description: str):
+    """Run send(user_id) for every user concurrently, logging per-user failures.
+
+    Each chat still receives its own message chunks in order - only the
+    fan-out across chats is concurrent.
+    """
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    async def send_one(user_id: int):
+        async with semaphore:
+            try:
+                await send(user_id)
+            except Exception as e:
+                logger.error(f"Failed to send {description} to user {user_id}: {e}")
+
+    await asyncio.gather(*(send_one(user_id) for user_id in user_ids))
+
+
 async def send_scheduled_briefing(bot: Bot, user_ids: list[int]):
     """Send morning briefing to all authorized users."""
-    from .workflows import generate_briefing
-
     logger.info("Sending scheduled morning briefing")
 
     try:
         config = load_config()
-        output = generate_briefing(config)
-        for user_id in user_ids:
-            try:
-                await send_markdown(bot, output, chat_id=user_id)
-            except Exception as e:
-                logger.error(f"Failed to send briefing to user {user_id}: {e}")
+        output = await asyncio.to_thread(generate_briefing, config)
+        await _broadcast(
+            user_ids,
+            lambda user_id: send_markdown(bot, output, chat_id=user_id),
+            "briefing",
+        )
     except Exception as e:
         logger.error(f"Error generating briefing: {e}")
 
 
 async def send_scheduled_weekly_plan(bot: Bot, user_ids: list[int]):
     """Send weekly plan to all authorized users."""
-    from .workflows import generate_weekly_plan
-
     logger.info("Sending scheduled weekly plan")
 
     try:
         config = load_config()
-        output = generate_weekly_plan(config)
-        for user_id in user_ids:
-            try:
-                await send_markdown(bot, output, chat_id=user_id)
-            except Exception as e:
-                logger.error(f"Failed to send weekly plan to user {user_id}: {e}")
+        output = await asyncio.to_thread(generate_weekly_plan, config)
+        await _broadcast(
+            user_ids,
+            lambda user_id: send_markdown(bot, output, chat_id=user_id),
+            "weekly plan",
+        )
     except Exception as e:
         logger.error(f"Error generating weekly plan: {e}")
 
 
 async def send_scheduled_weekly_review(bot: Bot, user_ids: list[int]):
     """Send weekly review to all authorized users."""
-    from .workflows import generate_weekly_review
-
     logger.info("Sending scheduled weekly review")
 
     try:
         config = load_config()
-        output = generate_weekly_review(config)
-        for user_id in user_ids:
-            try:
-                await send_markdown(bot, output, chat_id=user_id)
-            except Exception as e:
-                logger.error(f"Failed to send weekly review to user {user_id}: {e}")
+        output = await asyncio.to_thread(generate_weekly_review, config)
+        await _broadcast(
+            user_ids,
+            lambda user_id: send_markdown(bot, output, chat_id=user_id),
+            "weekly review",
+        )
     except Exception as e:
         logger.error(f"Error generating weekly review: {e}")
 
@@ -286,25 +311,19 @@ async def send_recap_reminder(bot: Bot, user_ids: list[int], config):
     """Send evening recap reminder if no recap exists for today."""
     today = date.today()
 
-    if config.daily_journal_dir:
-        journal_dir = Path(config.daily_journal_dir).expanduser()
-    else:
-        journal_dir = FRIDAY_HOME / "journal" / "daily"
+    journal_dir = journal_dir_for(config)
 
     # Only remind if no recap exists in journal for today
-    journal_file = journal_dir / f"{today.isoformat()}.md"
-    recap_exists = journal_file.exists() and "## Evening Recap" in journal_file.read_text()
-
-    if not recap_exists:
+    if not journal_has_recap(journal_dir / f"{today.isoformat()}.md"):
         logger.info("Sending recap reminder")
-        for user_id in user_ids:
-            try:
-                await bot.send_message(
-                    chat_id=user_id,
-                    text="Time for your daily recap!\n\nUse /evening to reflect on today.",
-                )
-            except Exception as e:
-                logger.error(f"Failed to send recap reminder to user {user_id}: {e}")
+        await _broadcast(
+            user_ids,
+            lambda user_id: bot.send_message(
+                chat_id=user_id,
+                text="Time for your daily recap!\n\nUse /evening to reflect on today.",
+            ),
+            "recap reminder",
+        )
     else:
         logger.info("Recap already exists for today, skipping reminder")
 
@@ -1,8 +1,12 @@
 """Telegram command handlers."""
 
+import asyncio
 import logging
+import os
 import subprocess
-from datetime import date
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -10,7 +14,7 @@ logger = logging.getLogger(__name__)
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, ConversationHandler
 
-from .config import load_config, FRIDAY_HOME
+from .config import journal_dir_for, load_config
 from .telegram_format import send_markdown
 from .recap import Recap, RecapMode, determine_recap_mode
 from .telegram_states import RecapStates
@@ -19,6 +23,30 @@ from .ticktick import TickTickClient, AuthenticationError
 from .workflows import generate_briefing, generate_weekly_plan, generate_weekly_review, get_journal
 
 
+def _read_journal_file(journal_file: Path) -> str | None:
+    """Read a journal file in one go. Returns None if it doesn't exist."""
+    try:
+        return journal_file.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def journal_has_recap(journal_file: Path) -> bool:
+    """Check whether a journal file already contains an evening recap."""
+    return "## Evening Recap" in (_read_journal_file(journal_file) or "")
+
+
+def _new_recap_data(day: date) -> dict:
+    """Fresh recap state for the conversation's user_data."""
+    return {
+        "date": day.isoformat(),
+        "wins": [],
+        "blockers": [],
+        "energy": None,
+        "tomorrow_focus": "",
+    }
+
+
 # ============== Simple Commands ==============
 
 
@@ -61,8 +89,9 @@ async def help_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def tasks_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /tasks command - list priority tasks."""
     try:
+        # Network calls run off the event loop so other updates keep flowing
         client = TickTickClient()
-        priority_tasks = client.get_priority_tasks()
+        priority_tasks = await asyncio.to_thread(client.get_priority_tasks)
     except AuthenticationError:
         await update.message.reply_text("TickTick not connected. Run `friday auth` on CLI.")
         return
@@ -71,14 +100,13 @@ async def tasks_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("No priority tasks for today.")
         return
 
-    lines = []
-    for task in priority_tasks:
-        priority_marker = "!" * task.priority if task.priority else " "
-        due = f" (due {task.due_date})" if task.due_date else ""
-        lines.append(f"`[{priority_marker:3}]` {task.title}{due}")
+    lines = "\n".join(
+        f"`[{'!' * t.priority or ' ':3}]` {t.title}{f' (due {t.due_date})' if t.due_date else ''}"
+        for t in priority_tasks
+    )
 
     await update.message.reply_text(
-        "*Priority Tasks*\n\n" + "\n".join(lines),
+        "*Priority Tasks*\n\n" + lines,
         parse_mode="Markdown",
     )
 
@@ -88,7 +116,7 @@ async def calendar_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     config = load_config()
 
     try:
-        events = cal.fetch_all_events(config, days=1)
+        events = await asyncio.to_thread(cal.fetch_all_events, config, days=1)
     except Exception as e:
         await update.message.reply_text(f"Failed to fetch calendar: {e}")
         return
@@ -97,21 +125,16 @@ async def calendar_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("No events today.")
         return
 
-    lines = []
-    current_date = None
-    for event in events:
-        event_date = event.start.date()
-        if event_date != current_date:
-            if current_date is not None:
-                lines.append("")
-            lines.append(f"*{event_date.strftime('%A, %B %d')}*")
-            current_date = event_date
-
-        time_str = event.format_time()
-        loc = f" @ {event.location}" if event.location else ""
-        lines.append(f"  `{time_str:8}` {event.title}{loc}")
+    days = "\n\n".join(
+        f"*{event_date.strftime('%A, %B %d')}*\n"
+        + "\n".join(
+            f"  `{e.format_time():8}` {e.title}{f' @ {e.location}' if e.location else ''}"
+            for e in day_events
+        )
+        for event_date, day_events in groupby(events, key=lambda e: e.start.date())
+    )
 
-    await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+    await update.message.reply_text(days, parse_mode="Markdown")
 
 
 async def status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -121,7 +144,7 @@ async def status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Get calendar
     try:
-        events = cal.fetch_today(config)
+        events = await asyncio.to_thread(cal.fetch_today, config)
         calendar_text = (
             "\n".join(f"  {e.format_time()} {e.title}" for e in events[:5])
             or "  No events"
@@ -133,7 +156,7 @@ async def status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Get tasks
     try:
         client = TickTickClient()
-        tasks = client.get_priority_tasks()[:5]
+        tasks = (await asyncio.to_thread(client.get_priority_tasks))[:5]
         tasks_text = (
             "\n".join(f"  - {t.title}" for t in tasks) or "  No priority tasks"
         )
@@ -141,13 +164,9 @@ async def status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         tasks_text = "  (TickTick not connected)"
 
     # Check recap status (now stored in journal)
-    if config.daily_journal_dir:
-        journal_dir = Path(config.daily_journal_dir).expanduser()
-    else:
-        journal_dir = FRIDAY_HOME / "journal" / "daily"
+    journal_dir = journal_dir_for(config)
     journal_file = journal_dir / f"{today.isoformat()}.md"
-    recap_exists = journal_file.exists() and "## Evening Recap" in journal_file.read_text()
-    recap_status = "Done" if recap_exists else "Pending"
+    recap_status = "Done" if journal_has_recap(journal_file) else "Pending"
 
     await update.message.reply_text(
         f"*Status for {today.strftime('%A, %b %d')}*\n\n"
@@ -158,35 +177,44 @@ async def status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
 
+@lru_cache(maxsize=1)
+def _version_text() -> str | None:
+    """Describe the running commit. Resolved once - it can't change until restart."""
+    result = subprocess.run(
+        ["git", "log", "-1", "--format=%H%n%s%n%ci"],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent,
+        timeout=5,
+    )
+    if result.returncode != 0:
+        return None
+
+    lines = result.stdout.strip().split("\n")
+    commit_hash = lines[0][:7]  # Short hash
+    message = lines[1]
+    timestamp = lines[2]
+    return (
+        f"*Friday Bot Version*\n\n"
+        f"Commit: `{commit_hash}`\n"
+        f"Message: {message}\n"
+        f"Date: {timestamp}"
+    )
+
+
 async def version_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /version command - show bot version from git."""
     try:
-        # Get the most recent commit info
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%H%n%s%n%ci"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent,
-            timeout=5,
-        )
-
-        if result.returncode == 0:
-            lines = result.stdout.strip().split("\n")
-            commit_hash = lines[0][:7]  # Short hash
-            message = lines[1]
-            timestamp = lines[2]
-
-            await update.message.reply_text(
-                f"*Friday Bot Version*\n\n"
-                f"Commit: `{commit_hash}`\n"
-                f"Message: {message}\n"
-                f"Date: {timestamp}",
-                parse_mode="Markdown",
-            )
-        else:
-            await update.message.reply_text("Unable to get version info.")
+        version_text = _version_text()
     except Exception as e:
         await update.message.reply_text(f"Error getting version: {e}")
+        return
+
+    if version_text is None:
+        await update.message.reply_text("Unable to get version info.")
+        return
+
+    await update.message.reply_text(version_text, parse_mode="Markdown")
 
 
 async def journal_read_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -195,23 +223,22 @@ async def journal_read_handler(update: Update, context: ContextTypes.DEFAULT_TYP
     today = date.today()
 
     # Determine journal directory
-    if config.daily_journal_dir:
-        journal_dir = Path(config.daily_journal_dir).expanduser()
-    else:
-        journal_dir = FRIDAY_HOME / "journal" / "daily"
+    journal_dir = journal_dir_for(config)
 
     journal_file = journal_dir / f"{today.isoformat()}.md"
+    day_label = today.strftime('%A, %b %d')
 
-    if not journal_file.exists():
-        await update.message.reply_text(f"No journal entry for {today.strftime('%A, %b %d')}.")
+    content = _read_journal_file(journal_file)
+    if content is None:
+        await update.message.reply_text(f"No journal entry for {day_label}.")
         return
 
-    content = journal_file.read_text().strip()
+    content = content.strip()
     if not content:
-        await update.message.reply_text(f"Journal for {today.strftime('%A, %b %d')} is empty.")
+        await update.message.reply_text(f"Journal for {day_label} is empty.")
         return
 
-    header = f"*Journal for {today.strftime('%A, %b %d')}*\n\n"
+    header = f"*Journal for {day_label}*\n\n"
     message = header + content
 
     # Telegram has 4096 char limit, split if needed
@@ -223,14 +250,45 @@ async def journal_read_handler(update: Update, context: ContextTypes.DEFAULT_TYP
         await update.message.reply_text(message, parse_mode="Markdown")
 
 
+# Flush streamed output once this much is buffered (Telegram's limit is 4096)
+STREAM_FLUSH_CHARS = 3500
+
+
+async def _stream_reply(message, generate, config) -> None:
+    """Run a generate_* workflow in a thread, replying as output streams in.
+
+    Output is sent at paragraph boundaries so Markdown isn't cut mid-block.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+    def on_chunk(chunk: str) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, chunk)
+
+    task = asyncio.ensure_future(asyncio.to_thread(generate, config, on_chunk=on_chunk))
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+
+    buffer = ""
+    while (chunk := await queue.get()) is not None:
+        buffer += chunk
+        if len(buffer) >= STREAM_FLUSH_CHARS:
+            cut = buffer.rfind("\n\n")
+            if cut > 0:
+                await send_markdown(message, buffer[:cut])
+                buffer = buffer[cut + 2:]
+
+    await task  # re-raise generation errors
+    if buffer.strip():
+        await send_markdown(message, buffer.strip())
+
+
 async def briefing_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /briefing command."""
     await update.message.reply_text("Generating your briefing...")
 
     config = load_config()
     try:
-        output = generate_briefing(config)
-        await send_markdown(update.message, output)
+        await _stream_reply(update.message, generate_briefing, config)
     except RuntimeError as e:
         await update.message.reply_text(f"Failed to generate briefing: {e}")
 
@@ -241,8 +299,7 @@ async def week_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     config = load_config()
     try:
-        output = generate_weekly_plan(config)
-        await send_markdown(update.message, output)
+        await _stream_reply(update.message, generate_weekly_plan, config)
     except RuntimeError as e:
         await update.message.reply_text(f"Failed to generate weekly plan: {e}")
 
@@ -253,8 +310,7 @@ async def review_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     config = load_config()
     try:
-        output = generate_weekly_review(config)
-        await send_markdown(update.message, output)
+        await _stream_reply(update.message, generate_weekly_review, config)
     except RuntimeError as e:
         await update.message.reply_text(f"Failed to generate weekly review: {e}")
 
@@ -264,17 +320,12 @@ async def review_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def journal_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle non-command messages by appending them to the daily journal."""
-    from datetime import datetime
-
     config = load_config()
     today = date.today()
     now = datetime.now()
 
     # Determine journal directory
-    if config.daily_journal_dir:
-        journal_dir = Path(config.daily_journal_dir).expanduser()
-    else:
-        journal_dir = FRIDAY_HOME / "journal" / "daily"
+    journal_dir = journal_dir_for(config)
     journal_dir.mkdir(parents=True, exist_ok=True)
 
     # Get message text
@@ -287,10 +338,31 @@ async def journal_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     entry = f"- [{timestamp}] {text}\n"
 
     # Append to daily journal
-    journal_file = journal_dir / f"{today.isoformat()}.md"
+    _append_note(journal_dir / f"{today.isoformat()}.md", entry)
+
+    await update.message.reply_text("Added to journal.")
+
+
+# Journal files known to already have a Notes section, so follow-up
+# messages can be appended without re-reading the whole file
+_notes_header_files: set[Path] = set()
+
+
+def _append_note(journal_file: Path, entry: str) -> None:
+    """Append a note entry, adding the Notes section on first use."""
+    if journal_file in _notes_header_files:
+        try:
+            # No O_CREAT: if the file was removed, fall through and recreate it
+            fd = os.open(journal_file, os.O_WRONLY | os.O_APPEND)
+        except FileNotFoundError:
+            _notes_header_files.discard(journal_file)
+        else:
+            with open(fd, "a") as f:
+                f.write(entry)
+            return
 
-    if journal_file.exists():
-        content = journal_file.read_text()
+    content = _read_journal_file(journal_file)
+    if content is not None:
         # Check if there's already a Notes section
         if "## Notes" in content:
             # Append to existing Notes section
@@ -304,11 +376,51 @@ async def journal_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         # Create new file with Notes section
         journal_file.write_text(f"## Notes\n\n{entry}")
 
-    await update.message.reply_text("Added to journal.")
+    # Only today's file receives notes, so forget earlier days
+    _notes_header_files.clear()
+    _notes_header_files.add(journal_file)
 
 
 # ============== Recap Conversation ==============
 
+# Quick-pick buttons as (button label, recorded value). Callback data is the
+# prefix plus the option's index, e.g. "w0", keeping payloads tiny.
+WIN_OPTIONS = (
+    ("Good focus", "Good focus block"),
+    ("Shipped something", "Shipped feature"),
+    ("Productive meeting", "Productive meeting"),
+    ("Cleared backlog", "Cleared backlog"),
+)
+BLOCKER_OPTIONS = (
+    ("Meetings", "Too many meetings"),
+    ("Interruptions", "Interruptions"),
+    ("Low energy", "Low energy"),
+    ("Unclear priorities", "Unclear priorities"),
+)
+ENERGY_OPTIONS = (
+    ("High", "high"),
+    ("Medium", "medium"),
+    ("Low", "low"),
+)
+
+
+def _option_buttons(options, prefix: str) -> list[InlineKeyboardButton]:
+    """Build one button per option with index-encoded callback data."""
+    return [
+        InlineKeyboardButton(label, callback_data=f"{prefix}{i}")
+        for i, (label, _) in enumerate(options)
+    ]
+
+
+def _decode_option(data: str, prefix: str, options) -> str | None:
+    """Map callback data like "w2" back to its option value."""
+    if data[:1] != prefix or not data[1:].isdigit():
+        return None
+    index = int(data[1:])
+    if index >= len(options):
+        return None
+    return options[index][1]
+
 
 async def recap_start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Start the recap conversation."""
@@ -316,17 +428,17 @@ async def recap_start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
     today = date.today()
 
     # Determine journal directory
-    if config.daily_journal_dir:
-        journal_dir = Path(config.daily_journal_dir).expanduser()
-    else:
-        journal_dir = FRIDAY_HOME / "journal" / "daily"
+    journal_dir = journal_dir_for(config)
 
     # Store journal_dir in context for later use
     context.user_data["journal_dir"] = str(journal_dir)
 
+    # Initialize recap data in context. Set before any confirmation so the
+    # recap keeps today's date even if it's confirmed after midnight.
+    context.user_data["recap"] = _new_recap_data(today)
+
     # Check if recap already exists in journal
-    journal_file = journal_dir / f"{today.isoformat()}.md"
-    if journal_file.exists() and "## Evening Recap" in journal_file.read_text():
+    if journal_has_recap(journal_dir / f"{today.isoformat()}.md"):
         keyboard = [
             [
                 InlineKeyboardButton("Yes, add another", callback_data="recap_overwrite"),
@@ -339,29 +451,15 @@ async def recap_start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
         return RecapStates.CONFIRM_OVERWRITE
 
-    # Initialize recap data in context
-    context.user_data["recap"] = {
-        "date": today.isoformat(),
-        "wins": [],
-        "blockers": [],
-        "energy": None,
-        "tomorrow_focus": "",
-    }
-
     return await _prompt_for_wins(update, context)
 
 
 async def _prompt_for_wins(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Send the wins prompt with quick options."""
+    buttons = _option_buttons(WIN_OPTIONS, "w")
     keyboard = [
-        [
-            InlineKeyboardButton("Good focus", callback_data="win:Good focus block"),
-            InlineKeyboardButton("Shipped something", callback_data="win:Shipped feature"),
-        ],
-        [
-            InlineKeyboardButton("Productive meeting", callback_data="win:Productive meeting"),
-            InlineKeyboardButton("Cleared backlog", callback_data="win:Cleared backlog"),
-        ],
+        buttons[:2],
+        buttons[2:],
         [InlineKeyboardButton("Done with wins ->", callback_data="wins_done")],
     ]
 
@@ -393,18 +491,12 @@ async def recap_confirm_handler(update: Update, context: ContextTypes.DEFAULT_TY
     await query.answer()
 
     if query.data == "recap_cancel":
+        context.user_data.pop("recap", None)
+        context.user_data.pop("journal_dir", None)
         await query.edit_message_text("Recap cancelled.")
         return ConversationHandler.END
 
     if query.data == "recap_overwrite":
-        today = date.today()
-        context.user_data["recap"] = {
-            "date": today.isoformat(),
-            "wins": [],
-            "blockers": [],
-            "energy": None,
-            "tomorrow_focus": "",
-        }
         return await _prompt_for_wins(update, context)
 
     return RecapStates.CONFIRM_OVERWRITE
@@ -419,15 +511,10 @@ async def recap_wins_handler(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
         if query.data == "wins_done":
             # Move to blockers
+            buttons = _option_buttons(BLOCKER_OPTIONS, "b")
             keyboard = [
-                [
-                    InlineKeyboardButton("Meetings", callback_data="blocker:Too many meetings"),
-                    InlineKeyboardButton("Interruptions", callback_data="blocker:Interruptions"),
-                ],
-                [
-                    InlineKeyboardButton("Low energy", callback_data="blocker:Low energy"),
-                    InlineKeyboardButton("Unclear priorities", callback_data="blocker:Unclear priorities"),
-                ],
+                buttons[:2],
+                buttons[2:],
                 [InlineKeyboardButton("No blockers ->", callback_data="blockers_done")],
             ]
             wins_count = len(context.user_data["recap"]["wins"])
@@ -440,8 +527,8 @@ async def recap_wins_handler(update: Update, context: ContextTypes.DEFAULT_TYPE)
             )
             return RecapStates.BLOCKERS
 
-        if query.data.startswith("win:"):
-            win = query.data[4:]
+        win = _decode_option(query.data, "w", WIN_OPTIONS)
+        if win is not None:
             context.user_data["recap"]["wins"].append(win)
             await query.answer(f"Added: {win}")
             return RecapStates.WINS
@@ -472,13 +559,7 @@ async def recap_blockers_handler(update: Update, context: ContextTypes.DEFAULT_T
 
         if query.data == "blockers_done":
             # Move to energy
-            keyboard = [
-                [
-                    InlineKeyboardButton("High", callback_data="energy:high"),
-                    InlineKeyboardButton("Medium", callback_data="energy:medium"),
-                    InlineKeyboardButton("Low", callback_data="energy:low"),
-                ],
-            ]
+            keyboard = [_option_buttons(ENERGY_OPTIONS, "e")]
             blockers_count = len(context.user_data["recap"]["blockers"])
             await query.edit_message_text(
                 f"Blockers recorded: {blockers_count}\n\n"
@@ -487,8 +568,8 @@ async def recap_blockers_handler(update: Update, context: ContextTypes.DEFAULT_T
             )
             return RecapStates.ENERGY
 
-        if query.data.startswith("blocker:"):
-            blocker = query.data[8:]
+        blocker = _decode_option(query.data, "b", BLOCKER_OPTIONS)
+        if blocker is not None:
             context.user_data["recap"]["blockers"].append(blocker)
             await query.answer(f"Added: {blocker}")
             return RecapStates.BLOCKERS
@@ -515,8 +596,8 @@ async def recap_energy_handler(update: Update, context: ContextTypes.DEFAULT_TYP
     query = update.callback_query
     await query.answer()
 
-    if query.data.startswith("energy:"):
-        energy = query.data[7:]
+    energy = _decode_option(query.data, "e", ENERGY_OPTIONS)
+    if energy is not None:
         context.user_data["recap"]["energy"] = energy
 
         await query.edit_message_text(
@@ -540,10 +621,7 @@ async def recap_tomorrow_handler(update: Update, context: ContextTypes.DEFAULT_T
     config = load_config()
 
     # Get journal directory
-    if config.daily_journal_dir:
-        journal_dir = Path(config.daily_journal_dir).expanduser()
-    else:
-        journal_dir = FRIDAY_HOME / "journal" / "daily"
+    journal_dir = journal_dir_for(config)
     journal_dir.mkdir(parents=True, exist_ok=True)
 
     try:
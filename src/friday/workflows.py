@@ -4,60 +4,137 @@ Each generate_* function: compiles a prompt, runs Claude, saves to journal,
 and returns the output string.
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from itertools import groupby, islice
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 from .adapters.claude_cli import ClaudeCLIService
 from .adapters.file_journal import FileJournalStore
-from .config import FRIDAY_HOME, Config, load_config
+from .config import FRIDAY_HOME, Config, journal_dir_for, load_config
+from .core.briefing import format_note_line, format_task_line
+from .core.tasks import Task, categorize_tasks, classify_tasks, filter_notes, filter_overdue, sort_by_priority
+from .ports.journal_store import JournalStore
+from .recap import RecapMode, determine_recap_mode
 from . import calendar as cal
 from .ticktick import AuthenticationError, TickTickClient
 
 
 def get_journal(config: Config) -> FileJournalStore:
     """Resolve journal directory from config."""
-    if config.daily_journal_dir:
-        return FileJournalStore(Path(config.daily_journal_dir).expanduser())
-    return FileJournalStore(FRIDAY_HOME / "journal" / "daily")
+    return FileJournalStore(journal_dir_for(config))
+
+
+def generate_briefing(
+    config: Config,
+    on_chunk: Callable[[str], None] | None = None,
+    as_of: date | None = None,
+    journal: JournalStore | None = None,
+) -> str:
+    """Compile briefing prompt, run Claude, save to journal, return output.
+
+    as_of (default today) picks the date the briefing is compiled for and
+    the journal entry it is saved to. Callers running several workflows
+    can pass one journal to share between them.
+    """
+    return _generate(config, compile_briefing, "Morning Briefing", on_chunk, as_of, journal)
+
+
+def generate_weekly_plan(
+    config: Config,
+    on_chunk: Callable[[str], None] | None = None,
+    as_of: date | None = None,
+    journal: JournalStore | None = None,
+) -> str:
+    """Compile weekly plan prompt, run Claude, save to journal, return output."""
+    return _generate(config, compile_week, "Weekly Plan", on_chunk, as_of, journal)
 
 
-def generate_briefing(config: Config) -> str:
-    """Compile briefing prompt, run Claude, save to journal, return output."""
-    prompt = compile_briefing()
-    claude = ClaudeCLIService(cwd=FRIDAY_HOME)
-    output = claude.generate(prompt).strip()
-    journal = get_journal(config)
-    journal.append(date.today(), "Morning Briefing", output)
+def generate_weekly_review(
+    config: Config,
+    on_chunk: Callable[[str], None] | None = None,
+    as_of: date | None = None,
+    journal: JournalStore | None = None,
+) -> str:
+    """Compile weekly review prompt, run Claude, save to journal, return output."""
+    return _generate(config, compile_review, "Weekly Review", on_chunk, as_of, journal)
+
+
+def _generate(
+    config: Config,
+    compile_prompt: Callable[[Config, date], str],
+    section_header: str,
+    on_chunk: Callable[[str], None] | None,
+    as_of: date | None,
+    journal: JournalStore | None,
+) -> str:
+    """Shared body of the generate_* workflows."""
+    today = as_of or date.today()
+    output = _run_claude(compile_prompt(config, today), on_chunk)
+    (journal or get_journal(config)).append(today, section_header, output)
     return output
 
 
-def generate_weekly_plan(config: Config) -> str:
-    """Compile weekly plan prompt, run Claude, save to journal, return output."""
-    prompt = compile_week()
+def _run_claude(prompt: str, on_chunk: Callable[[str], None] | None = None) -> str:
+    """Run Claude on a prompt, passing output to on_chunk as it streams in."""
     claude = ClaudeCLIService(cwd=FRIDAY_HOME)
-    output = claude.generate(prompt).strip()
-    journal = get_journal(config)
-    journal.append(date.today(), "Weekly Plan", output)
-    return output
-
+    if on_chunk is None:
+        return claude.generate(prompt).strip()
 
-def generate_weekly_review(config: Config) -> str:
-    """Compile weekly review prompt, run Claude, save to journal, return output."""
-    prompt = compile_review()
-    claude = ClaudeCLIService(cwd=FRIDAY_HOME)
-    output = claude.generate(prompt).strip()
-    journal = get_journal(config)
-    journal.append(date.today(), "Weekly Review", output)
-    return output
+    parts = []
+    for chunk in claude.stream(prompt):
+        parts.append(chunk)
+        on_chunk(chunk)
+    return "".join(parts).strip()
 
 
 # ============== Prompt Compilation ==============
 
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+@lru_cache(maxsize=8)
+def _load_template(path: Path, mtime_ns: int) -> tuple[str, ...]:
+    """Read a prompt template, pre-split around its placeholders.
+
+    Even indexes hold literal text, odd indexes placeholder names.
+    mtime_ns only serves as a cache key.
+    """
+    return tuple(_PLACEHOLDER_RE.split(path.read_text()))
 
-def compile_briefing() -> str:
+
+def _render_template(path: Path, values: dict[str, str]) -> str | None:
+    """Fill {{NAME}} placeholders in a template file in a single pass.
+
+    Returns None if the template doesn't exist. Unknown placeholders are
+    left untouched.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    parts = _load_template(path, mtime_ns)
+    if len(parts) == 1:  # No placeholders
+        return parts[0]
+    return "".join(
+        part if i % 2 == 0 else values.get(part, "{{" + part + "}}")
+        for i, part in enumerate(parts)
+    )
+
+
+def _fetch_all_tasks(config: Config) -> list[Task]:
+    """Fetch every TickTick task. Raises AuthenticationError if not connected."""
+    return TickTickClient(config).get_all_tasks()
+
+
+def compile_briefing(config: Config | None = None, today: date | None = None) -> str:
     """Compile the daily briefing prompt."""
-    config = load_config()
-    today = date.today()
+    config = config or load_config()
+    today = today or date.today()
     now = datetime.now()
 
     # Parse work hours
@@ -66,41 +143,26 @@ def compile_briefing() -> str:
     work_end = int(work_end_str.split(":")[0])
     is_work_hours = work_start <= now.hour < work_end
 
-    # Fetch all tasks and filter to actionable ones
-    actionable_tasks_md = ""
-    work_tasks = []
-    personal_tasks = []
+    # Tasks and calendar are independent network calls - fetch them together
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        tasks_future = pool.submit(_fetch_all_tasks, config)
+        events_future = pool.submit(cal.fetch_today, config)
 
+    # Fetch all tasks and filter to actionable ones
     notes_md = ""
     try:
-        from .core.tasks import filter_actionable, filter_notes
+        all_tasks = tasks_future.result()
 
-        client = TickTickClient()
-        all_tasks = client.get_all_tasks()
+        # Actionable tasks split by work/personal, plus notes, in one pass
+        buckets = classify_tasks(
+            all_tasks, config.work_task_lists, config.personal_task_lists, urgent_days=3, as_of=today
+        )
+        work_tasks, personal_tasks, other_tasks = buckets.work, buckets.personal, buckets.other
 
-        actionable = filter_actionable(all_tasks, urgent_days=3)
-
-        # Split by work/personal
-        work_tasks = [t for t in actionable if t.project_name in config.work_task_lists]
-        personal_tasks = [t for t in actionable if t.project_name in config.personal_task_lists]
-        other_tasks = [t for t in actionable if t.project_name not in config.work_task_lists and t.project_name not in config.personal_task_lists]
-
-        def format_task(t):
-            days_until = (t.due_date - today).days if t.due_date else None
-            urgency = ""
-            if days_until is not None:
-                if days_until < 0:
-                    urgency = f"OVERDUE by {-days_until}d"
-                elif days_until == 0:
-                    urgency = "due TODAY"
-                else:
-                    urgency = f"due in {days_until}d"
-            quadrant = t.quadrant_label()
-            return f"- [{quadrant}] {t.title} ({urgency}, project: {t.project_name})"
-
-        work_tasks_md = "\n".join(format_task(t) for t in work_tasks) or "None"
-        personal_tasks_md = "\n".join(format_task(t) for t in personal_tasks) or "None"
-        other_tasks_md = "\n".join(format_task(t) for t in other_tasks) or "None"
+        format_task = partial(format_task_line, as_of=today)
+        work_tasks_md = "\n".join(map(format_task, work_tasks)) or "None"
+        personal_tasks_md = "\n".join(map(format_task, personal_tasks)) or "None"
+        other_tasks_md = "\n".join(map(format_task, other_tasks)) or "None"
 
         actionable_tasks_md = f"""### Work Tasks ({', '.join(config.work_task_lists)})
 {work_tasks_md}
@@ -112,24 +174,14 @@ def compile_briefing() -> str:
 {other_tasks_md}"""
 
         # Notes = time-relevant reminders, not tasks to complete
-        notes = filter_notes(all_tasks, urgent_days=3)
-        if notes:
-            def format_note(t):
-                days_until = (t.due_date - today).days
-                if days_until < 0:
-                    when = f"since {-days_until}d ago"
-                elif days_until == 0:
-                    when = "today"
-                else:
-                    when = f"in {days_until}d"
-                return f"- {t.title} ({when}, project: {t.project_name})"
-            notes_md = "\n".join(format_note(n) for n in notes)
+        if buckets.notes:
+            notes_md = "\n".join(map(partial(format_note_line, as_of=today), buckets.notes))
 
     except AuthenticationError:
         actionable_tasks_md = "(TickTick not authenticated - run 'friday auth')"
 
     # Calendar events
-    events = cal.fetch_today(config)
+    events = events_future.result()
     events = cal.drop_redundant_ooo(events)
     calendar_md = "\n".join(
         f"- {e.format_time()} - {e.end.strftime('%H:%M') if e.end and not e.all_day else ''} {e.title}".strip()
@@ -144,18 +196,22 @@ def compile_briefing() -> str:
     # Context for Claude
     time_context = "during work hours" if is_work_hours else "outside work hours"
     task_focus = "work" if is_work_hours else "personal"
-
-    template = FRIDAY_HOME / "templates" / "daily-briefing.md"
-    if template.exists():
-        prompt = template.read_text()
-        prompt = prompt.replace("{{DATE}}", today.isoformat())
-        prompt = prompt.replace("{{DAY_OF_WEEK}}", today.strftime("%A"))
-        prompt = prompt.replace("{{YESTERDAY_CONTEXT}}", "")
-        prompt = prompt.replace("{{TASKS}}", actionable_tasks_md)
-        prompt = prompt.replace("{{NOTES}}", notes_md or "None")
-        prompt = prompt.replace("{{CALENDAR}}", calendar_md)
-        prompt = prompt.replace("{{FREE_SLOTS}}", free_slots_md)
-        prompt = prompt.replace("{{TIME_CONTEXT}}", f"Currently {time_context} ({config.work_hours}). Focus on {task_focus} tasks.")
+    context_md = f"Currently {time_context} ({config.work_hours}). Focus on {task_focus} tasks."
+
+    prompt = _render_template(
+        FRIDAY_HOME / "templates" / "daily-briefing.md",
+        {
+            "DATE": today.isoformat(),
+            "DAY_OF_WEEK": today.strftime("%A"),
+            "YESTERDAY_CONTEXT": "",
+            "TASKS": actionable_tasks_md,
+            "NOTES": notes_md or "None",
+            "CALENDAR": calendar_md,
+            "FREE_SLOTS": free_slots_md,
+            "TIME_CONTEXT": context_md,
+        },
+    )
+    if prompt is not None:
         return prompt
 
     # Fallback inline template
@@ -165,7 +221,7 @@ def compile_briefing() -> str:
 {today.strftime("%A, %B %d, %Y")}
 
 ## Context
-Currently {time_context} ({config.work_hours}). Focus on {task_focus} tasks.
+{context_md}
 
 ## Today's Calendar
 {calendar_md}
@@ -191,34 +247,40 @@ These are not tasks to complete — they are time-relevant info to keep in mind.
 """
 
 
-def compile_review() -> str:
+def compile_review(config: Config | None = None, today: date | None = None) -> str:
     """Compile the weekly review prompt."""
-    config = load_config()
-    today = date.today()
+    config = config or load_config()
+    today = today or date.today()
 
     # Get this week's journals (which now include recaps)
-    if config.daily_journal_dir:
-        journal_dir = Path(config.daily_journal_dir).expanduser()
-    else:
-        journal_dir = FRIDAY_HOME / "journal" / "daily"
+    journal_dir = journal_dir_for(config)
+
+    # The window is exactly 8 known filenames (today and the 7 days before)
+    wanted = {}
+    for days_ago in range(8):
+        d = today - timedelta(days=days_ago)
+        wanted[f"{d.isoformat()}.md"] = d
+
+    try:
+        with os.scandir(journal_dir) as it:
+            found = sorted((wanted[entry.name], entry.path) for entry in it if entry.name in wanted)
+    except FileNotFoundError:
+        found = []
 
     accomplishments = []
-    for journal_file in sorted(journal_dir.glob("*.md")):
-        try:
-            journal_date = date.fromisoformat(journal_file.stem)
-            days_ago = (today - journal_date).days
-            if 0 <= days_ago <= 7:
-                accomplishments.append(f"### {journal_date}\n{journal_file.read_text()}")
-        except ValueError:
-            continue
+    for journal_date, path in found:
+        with open(path) as f:
+            accomplishments.append(f"### {journal_date}\n{f.read()}")
 
     accomplishments_md = "\n\n".join(accomplishments) or "No journal entries this week."
 
     # Get overdue tasks
     try:
-        client = TickTickClient()
-        tasks = client.get_priority_tasks()
-        overdue = [t for t in tasks if t.due_date and t.due_date < today]
+        client = TickTickClient(config)
+        # Every project, not just PRIORITY_TASK_LISTS: the review should
+        # surface anything that slipped
+        tasks = client.get_all_tasks()
+        overdue = sort_by_priority([t for t in filter_overdue(tasks, today) if not t.is_note])
         overdue_md = "\n".join(f"- {t.title} (due: {t.due_date})" for t in overdue) or "None"
 
         inbox_tasks = client.get_inbox_tasks()
@@ -234,17 +296,20 @@ def compile_review() -> str:
         for e in next_week_events
     ) or "No events scheduled."
 
-    template = FRIDAY_HOME / "templates" / "weekly-review.md"
-    if template.exists():
-        prompt = template.read_text()
-        prompt = prompt.replace("{{DATE}}", today.isoformat())
-        prompt = prompt.replace("{{DAY_OF_WEEK}}", today.strftime("%A"))
-        prompt = prompt.replace("{{RECAP_SUMMARY}}", "")
-        prompt = prompt.replace("{{ACCOMPLISHMENTS}}", accomplishments_md)
-        prompt = prompt.replace("{{OVERDUE_TASKS}}", overdue_md)
-        prompt = prompt.replace("{{STUCK_TASKS}}", "N/A")
-        prompt = prompt.replace("{{INBOX_TASKS}}", inbox_md)
-        prompt = prompt.replace("{{NEXT_WEEK_CALENDAR}}", calendar_md)
+    prompt = _render_template(
+        FRIDAY_HOME / "templates" / "weekly-review.md",
+        {
+            "DATE": today.isoformat(),
+            "DAY_OF_WEEK": today.strftime("%A"),
+            "RECAP_SUMMARY": "",
+            "ACCOMPLISHMENTS": accomplishments_md,
+            "OVERDUE_TASKS": overdue_md,
+            "STUCK_TASKS": "N/A",
+            "INBOX_TASKS": inbox_md,
+            "NEXT_WEEK_CALENDAR": calendar_md,
+        },
+    )
+    if prompt is not None:
         return prompt
 
     # Fallback
@@ -272,10 +337,27 @@ def compile_review() -> str:
 """
 
 
-def compile_week() -> str:
+@lru_cache(maxsize=32)
+def _format_day(d: date) -> str:
+    """Day heading like 'Monday, January 13' (dates repeat across calls)."""
+    return d.strftime("%A, %B %d")
+
+
+def _week_calendar_lines(events: Iterable) -> Iterator[str]:
+    """Yield markdown lines for events, with a header for each new day."""
+    for i, (event_date, day) in enumerate(groupby(events, key=lambda e: e.start.date())):
+        if i:
+            yield ""
+        yield f"### {_format_day(event_date)}"
+        for e in day:
+            loc = f" @ {e.location}" if e.location else ""
+            yield f"- {e.format_time()} {e.title}{loc}"
+
+
+def compile_week(config: Config | None = None, today: date | None = None) -> str:
     """Compile the weekly planning prompt."""
-    config = load_config()
-    today = date.today()
+    config = config or load_config()
+    today = today or date.today()
 
     # Days remaining through Saturday (weekday 5 = Saturday)
     days_until_saturday = (5 - today.weekday()) % 7
@@ -288,50 +370,36 @@ def compile_week() -> str:
     work_start = int(work_start_str.split(":")[0])
     work_end = int(work_end_str.split(":")[0])
 
+    # Tasks and calendar are independent network calls - fetch them together
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        tasks_future = pool.submit(_fetch_all_tasks, config)
+        events_future = pool.submit(cal.fetch_all_events, config, days=days_remaining)
+
     # Calendar events with day headers
-    events = cal.fetch_all_events(config, days=days_remaining)
+    events = events_future.result()
     events = cal.drop_redundant_ooo(events)
-    calendar_lines = []
-    current_date = None
+    calendar_md = "\n".join(_week_calendar_lines(events)) or "No events this week."
+
+    # Free slots per workday
     day_events = {}  # date -> list of events for free slot calc
     for e in events:
-        event_date = e.start.date()
-        if event_date not in day_events:
-            day_events[event_date] = []
-        day_events[event_date].append(e)
-        if event_date != current_date:
-            if current_date is not None:
-                calendar_lines.append("")
-            calendar_lines.append(f"### {event_date.strftime('%A, %B %d')}")
-            current_date = event_date
-        time_str = e.format_time()
-        loc = f" @ {e.location}" if e.location else ""
-        calendar_lines.append(f"- {time_str} {e.title}{loc}")
-    calendar_md = "\n".join(calendar_lines) or "No events this week."
+        day_events.setdefault(e.start.date(), []).append(e)
 
-    # Free slots per workday
-    free_slots_lines = []
-    for i in range(days_remaining):
-        d = today + timedelta(days=i)
-        if d.weekday() >= 5:  # Skip weekends
-            continue
-        day_evts = day_events.get(d, [])
-        slots = cal.find_free_slots(day_evts, work_start=work_start, work_end=work_end, min_duration=30)
-        if slots:
-            free_slots_lines.append(f"**{d.strftime('%A, %B %d')}**: {', '.join(s.format() for s in slots)}")
-        else:
-            free_slots_lines.append(f"**{d.strftime('%A, %B %d')}**: No free slots")
-    free_slots_md = "\n".join(free_slots_lines) or "No workdays remaining this week."
+    def day_free_slots(d: date) -> str:
+        slots = cal.find_free_slots(day_events.get(d, []), work_start=work_start, work_end=work_end, min_duration=30)
+        return ", ".join(s.format() for s in slots) or "No free slots"
+
+    free_slots_md = "\n".join(
+        f"**{_format_day(d)}**: {day_free_slots(d)}"
+        for d in (today + timedelta(days=i) for i in range(days_remaining))
+        if d.weekday() < 5  # Skip weekends
+    ) or "No workdays remaining this week."
 
     # Tasks: due before end of Saturday OR priority >= 3
     end_of_saturday = today + timedelta(days=days_until_saturday)
-    tasks_md = ""
     notes_md = ""
     try:
-        from .core.tasks import filter_notes
-
-        client = TickTickClient()
-        all_tasks = client.get_all_tasks()
+        all_tasks = tasks_future.result()
 
         week_tasks = [
             t for t in all_tasks
@@ -339,26 +407,14 @@ def compile_week() -> str:
             and ((t.due_date and t.due_date <= end_of_saturday) or t.priority >= 3)
         ]
 
-        def format_task(t):
-            days_until = (t.due_date - today).days if t.due_date else None
-            urgency = ""
-            if days_until is not None:
-                if days_until < 0:
-                    urgency = f"OVERDUE by {-days_until}d"
-                elif days_until == 0:
-                    urgency = "due TODAY"
-                else:
-                    urgency = f"due in {days_until}d"
-            quadrant = t.quadrant_label()
-            return f"- [{quadrant}] {t.title} ({urgency}, project: {t.project_name})"
-
-        work_tasks = [t for t in week_tasks if t.project_name in config.work_task_lists]
-        personal_tasks = [t for t in week_tasks if t.project_name in config.personal_task_lists]
-        other_tasks = [t for t in week_tasks if t.project_name not in config.work_task_lists and t.project_name not in config.personal_task_lists]
-
-        work_md = "\n".join(format_task(t) for t in work_tasks) or "None"
-        personal_md = "\n".join(format_task(t) for t in personal_tasks) or "None"
-        other_md = "\n".join(format_task(t) for t in other_tasks) or "None"
+        work_tasks, personal_tasks, other_tasks = categorize_tasks(
+            week_tasks, config.work_task_lists, config.personal_task_lists
+        )
+
+        format_task = partial(format_task_line, as_of=today)
+        work_md = "\n".join(map(format_task, work_tasks)) or "None"
+        personal_md = "\n".join(map(format_task, personal_tasks)) or "None"
+        other_md = "\n".join(map(format_task, other_tasks)) or "None"
 
         tasks_md = f"""### Work Tasks
 {work_md}
@@ -371,28 +427,22 @@ def compile_week() -> str:
 
         notes = filter_notes(all_tasks, urgent_days=days_remaining)
         if notes:
-            def format_note(t):
-                days_until = (t.due_date - today).days
-                if days_until < 0:
-                    when = f"since {-days_until}d ago"
-                elif days_until == 0:
-                    when = "today"
-                else:
-                    when = f"in {days_until}d"
-                return f"- {t.title} ({when}, project: {t.project_name})"
-            notes_md = "\n".join(format_note(n) for n in notes)
+            notes_md = "\n".join(map(partial(format_note_line, as_of=today), notes))
     except AuthenticationError:
         tasks_md = "(TickTick not authenticated - run 'friday auth')"
 
-    template = FRIDAY_HOME / "templates" / "weekly-planning.md"
-    if template.exists():
-        prompt = template.read_text()
-        prompt = prompt.replace("{{DATE}}", today.isoformat())
-        prompt = prompt.replace("{{DAY_OF_WEEK}}", today.strftime("%A"))
-        prompt = prompt.replace("{{CALENDAR}}", calendar_md)
-        prompt = prompt.replace("{{FREE_SLOTS}}", free_slots_md)
-        prompt = prompt.replace("{{TASKS}}", tasks_md)
-        prompt = prompt.replace("{{NOTES}}", notes_md or "None")
+    prompt = _render_template(
+        FRIDAY_HOME / "templates" / "weekly-planning.md",
+        {
+            "DATE": today.isoformat(),
+            "DAY_OF_WEEK": today.strftime("%A"),
+            "CALENDAR": calendar_md,
+            "FREE_SLOTS": free_slots_md,
+            "TASKS": tasks_md,
+            "NOTES": notes_md or "None",
+        },
+    )
+    if prompt is not None:
         return prompt
 
     # Fallback inline template
@@ -424,15 +474,14 @@ These are not tasks to complete — they are time-relevant info to keep in mind.
 
 def compile_recap_prompt(target: date, config: Config, journal_dir: Path) -> str:
     """Compile context for deep recap mode."""
-    from .recap import determine_recap_mode, RecapMode
-
     # Determine mode
     try:
-        client = TickTickClient()
+        client = TickTickClient(config)
         ticktick_available = True
         all_tasks = client.get_all_tasks()
         # Get tasks completed today (high priority or due today that are marked done)
-        completed = [t for t in all_tasks if t.due_date == target]
+        # Only the first 10 are shown, so stop scanning once we have them
+        completed = list(islice((t for t in all_tasks if t.due_date == target), 10))
     except AuthenticationError:
         ticktick_available = False
         completed = []
@@ -446,17 +495,21 @@ def compile_recap_prompt(target: date, config: Config, journal_dir: Path) -> str
     ]
 
     if mode == RecapMode.FULL:
-        # Include morning briefing
+        # Include morning briefing, reading only as much as we'll show
         briefing_file = journal_dir / f"{target.isoformat()}.md"
-        if briefing_file.exists():
-            briefing = briefing_file.read_text()
+        try:
+            with open(briefing_file) as f:
+                briefing = f.read(2001)
+        except FileNotFoundError:
+            pass
+        else:
             # Truncate if very long
             if len(briefing) > 2000:
                 briefing = briefing[:2000] + "\n\n[... truncated ...]"
             sections.append(f"## This Morning's Plan\n\n{briefing}")
 
     if ticktick_available and completed:
-        completed_md = "\n".join(f"- {t.title}" for t in completed[:10])
+        completed_md = "\n".join(f"- {t.title}" for t in completed)
         sections.append(f"## Tasks Due Today\n\n{completed_md}")
 
     # Instructions based on mode
@@ -0,0 +1,13 @@
+"""Constants shared by the test modules."""
+
+from datetime import date, datetime, time
+
+TODAY = date(2025, 1, 15)  # A Wednesday
+WORK_DT = datetime.combine(TODAY, time(10, 0))
+OUTSIDE_WORK_DT = datetime.combine(TODAY, time(7, 0))
+
+# Calendar account folders
+WORK_CONFIG_DIR = "/home/user/.config/work"
+SCRATCH_CONFIG_DIR = "/tmp/test"
+WORK_ACCOUNT_DIR = "~/.gcalcli/work"
+WORK_ACCOUNT_LINE = f'GCALCLI_ACCOUNTS="{WORK_ACCOUNT_DIR}:Work"'
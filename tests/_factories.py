@@ -0,0 +1,68 @@
+"""Cached builders for test data. Results are shared, which is safe since Event is frozen."""
+
+from datetime import datetime, time
+from functools import lru_cache
+
+from friday.core.calendar import Event
+
+from tests._consts import TODAY
+
+
+@lru_cache(maxsize=None)
+def dt_at(hour: int, minute: int = 0) -> datetime:
+    """datetime on TODAY at the given hour and minute."""
+    return datetime.combine(TODAY, time(hour, minute))
+
+
+@lru_cache(maxsize=None)
+def make_event(
+    title: str,
+    start_hour: int,
+    end_hour: int,
+    all_day: bool = False,
+) -> Event:
+    """Build a test event on TODAY spanning whole hours."""
+    start = dt_at(start_hour)
+    end = dt_at(end_hour) if end_hour else None
+    return Event(
+        title=title,
+        start=start,
+        end=end,
+        location="",
+        calendar="Test",
+        all_day=all_day,
+        source="test",
+    )
+
+
+def _at(value: datetime | tuple[int, int]) -> datetime:
+    if isinstance(value, tuple):
+        return dt_at(*value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def build_event(
+    title: str,
+    start: datetime | tuple[int, int],
+    end: datetime | tuple[int, int] | None = None,
+    **overrides,
+) -> Event:
+    """Build a test event with test defaults.
+
+    start and end take a datetime or an (hour, minute) tuple on TODAY; any
+    other Event field can be overridden by keyword.
+    """
+    fields = {
+        "location": "",
+        "calendar": "Test",
+        "all_day": False,
+        "source": "test",
+        **overrides,
+    }
+    return Event(
+        title=title,
+        start=_at(start),
+        end=_at(end) if end is not None else None,
+        **fields,
+    )
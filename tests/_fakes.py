@@ -0,0 +1,41 @@
+"""Hand-written fakes for external services."""
+
+from collections.abc import Iterable
+
+
+class _FakeRequest:
+    def __init__(self, items):
+        self._items = items
+
+    def execute(self) -> dict:
+        return {"items": list(self._items)}
+
+
+class _FakeCollection:
+    def __init__(self, items, calls: list[dict]):
+        self._items = items
+        self._calls = calls
+
+    def list(self, **kwargs) -> _FakeRequest:
+        self._calls.append(kwargs)
+        return _FakeRequest(self._items)
+
+
+class FakeGoogleService:
+    """Stands in for a googleapiclient Calendar v3 service.
+
+    calendarList().list() returns the given calendars, and events().list()
+    returns the given events for every calendar queried. Arguments passed to
+    events().list() are recorded in event_queries.
+    """
+
+    def __init__(self, calendars: Iterable[dict] = (), events: Iterable[dict] = ()):
+        self._calendars = tuple(calendars)
+        self._events = tuple(events)
+        self.event_queries: list[dict] = []
+
+    def calendarList(self) -> _FakeCollection:
+        return _FakeCollection(self._calendars, [])
+
+    def events(self) -> _FakeCollection:
+        return _FakeCollection(self._events, self.event_queries)
@@ -0,0 +1,37 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from friday.config import clear_config_cache
+from tests._consts import TODAY
+from tests._factories import build_event, dt_at as _dt_at, make_event as _make_event
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_cache():
+    """Keep a Config parsed by one test from leaking into the next."""
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture(scope="session")
+def today():
+    return TODAY
+
+
+@pytest.fixture(scope="session")
+def dt_at():
+    """datetime on TODAY at the given hour and minute."""
+    return _dt_at
+
+
+@pytest.fixture(scope="session")
+def make_event():
+    """Factory for creating events."""
+    return _make_event
+
+
+@pytest.fixture(scope="session")
+def event_factory():
+    """Factory for events with test defaults (see build_event)."""
+    return build_event
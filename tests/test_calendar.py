@@ -1,11 +1,11 @@
 """Tests for core calendar logic."""
 
-from datetime import date, datetime, time, timedelta
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta
 
 import pytest
 
 from friday.core.calendar import (
-    Event,
     TimeSlot,
     find_free_slots,
     filter_events_by_date,
@@ -15,125 +15,77 @@ from friday.core.calendar import (
     is_during_hours,
 )
 
+from tests._consts import TODAY
 
-# Fixtures
-@pytest.fixture
-def today():
-    return date(2025, 1, 15)
-
-
-@pytest.fixture
-def make_event(today):
-    """Factory for creating events."""
-    def _make(
-        title: str,
-        start_hour: int,
-        end_hour: int,
-        all_day: bool = False,
-    ) -> Event:
-        start = datetime.combine(today, time(start_hour, 0))
-        end = datetime.combine(today, time(end_hour, 0)) if end_hour else None
-        return Event(
-            title=title,
-            start=start,
-            end=end,
-            location="",
-            calendar="Test",
-            all_day=all_day,
-            source="test",
-        )
-    return _make
+pytestmark = pytest.mark.parallel
+
+# Length of the 9-17 work day used throughout
+WORK_DAY_MINUTES = (17 - 9) * 60
 
 
 # Event class tests
 class TestEvent:
-    def test_format_time_regular(self, today):
-        event = Event(
-            title="Meeting",
-            start=datetime.combine(today, time(14, 30)),
-            end=datetime.combine(today, time(15, 30)),
-            location="",
-            calendar="Test",
-            all_day=False,
-            source="test",
-        )
+    def test_format_time_regular(self, event_factory):
+        event = event_factory("Meeting", (14, 30), (15, 30))
         assert event.format_time() == "14:30"
 
-    def test_format_time_all_day(self, today):
-        event = Event(
-            title="Holiday",
-            start=datetime.combine(today, time(0, 0)),
-            end=datetime.combine(today, time(23, 59)),
-            location="",
-            calendar="Test",
-            all_day=True,
-            source="test",
-        )
+    def test_format_time_all_day(self, event_factory):
+        event = event_factory("Holiday", (0, 0), (23, 59), all_day=True)
         assert event.format_time() == "All day"
 
-    def test_duration_minutes(self, today):
-        event = Event(
-            title="Meeting",
-            start=datetime.combine(today, time(14, 0)),
-            end=datetime.combine(today, time(15, 30)),
-            location="",
-            calendar="Test",
-            all_day=False,
-            source="test",
-        )
+    def test_duration_minutes(self, event_factory):
+        event = event_factory("Meeting", (14, 0), (15, 30))
         assert event.duration_minutes() == 90
 
-    def test_duration_minutes_no_end(self, today):
-        event = Event(
-            title="Meeting",
-            start=datetime.combine(today, time(14, 0)),
-            end=None,
-            location="",
-            calendar="Test",
-            all_day=False,
-            source="test",
-        )
+    def test_duration_minutes_no_end(self, event_factory):
+        event = event_factory("Meeting", (14, 0))
         assert event.duration_minutes() is None
 
+    def test_is_immutable(self, event_factory):
+        """Factories share events between tests, so they must not be mutable."""
+        event = event_factory("Meeting", (14, 0), (15, 0))
+        with pytest.raises(FrozenInstanceError):
+            event.title = "Changed"
+
 
 # TimeSlot class tests
 class TestTimeSlot:
-    def test_duration_minutes(self, today):
+    def test_duration_minutes(self, dt_at):
         slot = TimeSlot(
-            start=datetime.combine(today, time(9, 0)),
-            end=datetime.combine(today, time(10, 30)),
+            start=dt_at(9),
+            end=dt_at(10, 30),
         )
         assert slot.duration_minutes() == 90
 
-    def test_format(self, today):
+    def test_format(self, dt_at):
         slot = TimeSlot(
-            start=datetime.combine(today, time(9, 0)),
-            end=datetime.combine(today, time(10, 30)),
+            start=dt_at(9),
+            end=dt_at(10, 30),
         )
         assert slot.format() == "09:00-10:30 (90 min)"
 
-    def test_contains(self, today):
+    def test_contains(self, dt_at):
         slot = TimeSlot(
-            start=datetime.combine(today, time(9, 0)),
-            end=datetime.combine(today, time(12, 0)),
+            start=dt_at(9),
+            end=dt_at(12),
         )
-        assert slot.contains(datetime.combine(today, time(10, 0))) is True
-        assert slot.contains(datetime.combine(today, time(9, 0))) is True
-        assert slot.contains(datetime.combine(today, time(12, 0))) is False
-        assert slot.contains(datetime.combine(today, time(8, 0))) is False
+        assert slot.contains(dt_at(10)) is True
+        assert slot.contains(dt_at(9)) is True
+        assert slot.contains(dt_at(12)) is False
+        assert slot.contains(dt_at(8)) is False
 
-    def test_overlaps(self, today):
+    def test_overlaps(self, dt_at):
         slot1 = TimeSlot(
-            start=datetime.combine(today, time(9, 0)),
-            end=datetime.combine(today, time(11, 0)),
+            start=dt_at(9),
+            end=dt_at(11),
         )
         slot2 = TimeSlot(
-            start=datetime.combine(today, time(10, 0)),
-            end=datetime.combine(today, time(12, 0)),
+            start=dt_at(10),
+            end=dt_at(12),
         )
         slot3 = TimeSlot(
-            start=datetime.combine(today, time(11, 0)),
-            end=datetime.combine(today, time(13, 0)),
+            start=dt_at(11),
+            end=dt_at(13),
         )
 
         assert slot1.overlaps(slot2) is True
@@ -143,13 +95,13 @@ class TestTimeSlot:
 
 # find_free_slots tests
 class TestFindFreeSlots:
-    def test_no_events_returns_full_day(self, today):
+    def test_no_events_returns_full_day(self):
         """With no events, the entire work day is free."""
-        slots = find_free_slots([], work_start=9, work_end=17, target_date=today)
+        slots = find_free_slots([], work_start=9, work_end=17, target_date=TODAY)
         assert len(slots) == 1
         assert slots[0].start.hour == 9
         assert slots[0].end.hour == 17
-        assert slots[0].duration_minutes() == 480
+        assert slots[0].duration_minutes() == WORK_DAY_MINUTES
 
     def test_single_event_middle_of_day(self, make_event):
         """Single event in middle creates two free slots."""
@@ -222,22 +174,14 @@ class TestFindFreeSlots:
         assert slots[0].start.hour == 11
         assert slots[0].end.hour == 12
 
-    def test_all_day_events_ignored(self, today):
+    def test_all_day_events_ignored(self, event_factory):
         """All-day events don't block time slots."""
-        all_day = Event(
-            title="Holiday",
-            start=datetime.combine(today, time(0, 0)),
-            end=datetime.combine(today, time(23, 59)),
-            location="",
-            calendar="Test",
-            all_day=True,
-            source="test",
-        )
-        slots = find_free_slots([all_day], work_start=9, work_end=17, target_date=today)
+        all_day = event_factory("Holiday", (0, 0), (23, 59), all_day=True)
+        slots = find_free_slots([all_day], work_start=9, work_end=17, target_date=TODAY)
 
         # Should still have full day free since all-day events are excluded
         assert len(slots) == 1
-        assert slots[0].duration_minutes() == 480
+        assert slots[0].duration_minutes() == WORK_DAY_MINUTES
 
     def test_events_outside_work_hours_ignored(self, make_event):
         """Events outside work hours don't affect free slots."""
@@ -248,69 +192,41 @@ class TestFindFreeSlots:
         slots = find_free_slots(events, work_start=9, work_end=17)
 
         assert len(slots) == 1
-        assert slots[0].duration_minutes() == 480
+        assert slots[0].duration_minutes() == WORK_DAY_MINUTES
 
 
 # filter_events_by_date tests
 class TestFilterEventsByDate:
-    def test_filters_to_single_date(self, today):
+    def test_filters_to_single_date(self, event_factory, dt_at):
         events = [
-            Event(
-                title="Today",
-                start=datetime.combine(today, time(10, 0)),
-                end=datetime.combine(today, time(11, 0)),
-                location="",
-                calendar="Test",
-                all_day=False,
-                source="test",
-            ),
-            Event(
-                title="Tomorrow",
-                start=datetime.combine(today + timedelta(days=1), time(10, 0)),
-                end=datetime.combine(today + timedelta(days=1), time(11, 0)),
-                location="",
-                calendar="Test",
-                all_day=False,
-                source="test",
+            event_factory("Today", (10, 0), (11, 0)),
+            event_factory(
+                "Tomorrow",
+                dt_at(10) + timedelta(days=1),
+                dt_at(11) + timedelta(days=1),
             ),
         ]
 
-        filtered = filter_events_by_date(events, today)
+        filtered = filter_events_by_date(events, TODAY)
         assert len(filtered) == 1
         assert filtered[0].title == "Today"
 
-    def test_filters_to_date_range(self, today):
+    def test_filters_to_date_range(self, event_factory, dt_at):
         events = [
-            Event(
-                title="Day 1",
-                start=datetime.combine(today, time(10, 0)),
-                end=datetime.combine(today, time(11, 0)),
-                location="",
-                calendar="Test",
-                all_day=False,
-                source="test",
-            ),
-            Event(
-                title="Day 3",
-                start=datetime.combine(today + timedelta(days=2), time(10, 0)),
-                end=datetime.combine(today + timedelta(days=2), time(11, 0)),
-                location="",
-                calendar="Test",
-                all_day=False,
-                source="test",
+            event_factory("Day 1", (10, 0), (11, 0)),
+            event_factory(
+                "Day 3",
+                dt_at(10) + timedelta(days=2),
+                dt_at(11) + timedelta(days=2),
             ),
-            Event(
-                title="Day 5",
-                start=datetime.combine(today + timedelta(days=4), time(10, 0)),
-                end=datetime.combine(today + timedelta(days=4), time(11, 0)),
-                location="",
-                calendar="Test",
-                all_day=False,
-                source="test",
+            event_factory(
+                "Day 5",
+                dt_at(10) + timedelta(days=4),
+                dt_at(11) + timedelta(days=4),
             ),
         ]
 
-        filtered = filter_events_by_date(events, today, today + timedelta(days=3))
+        filtered = filter_events_by_date(events, TODAY, TODAY + timedelta(days=3))
         assert len(filtered) == 2
         titles = [e.title for e in filtered]
         assert "Day 1" in titles
@@ -320,35 +236,11 @@ class TestFilterEventsByDate:
 
 # sort_events_by_start tests
 class TestSortEventsByStart:
-    def test_sorts_chronologically(self, today):
+    def test_sorts_chronologically(self, event_factory):
         events = [
-            Event(
-                title="Third",
-                start=datetime.combine(today, time(15, 0)),
-                end=None,
-                location="",
-                calendar="Test",
-                all_day=False,
-                source="test",
-            ),
-            Event(
-                title="First",
-                start=datetime.combine(today, time(9, 0)),
-                end=None,
-                location="",
-                calendar="Test",
-                all_day=False,
-                source="test",
-            ),
-            Event(
-                title="Second",
-                start=datetime.combine(today, time(12, 0)),
-                end=None,
-                location="",
-                calendar="Test",
-                all_day=False,
-                source="test",
-            ),
+            event_factory("Third", (15, 0)),
+            event_factory("First", (9, 0)),
+            event_factory("Second", (12, 0)),
         ]
 
         sorted_events = sort_events_by_start(events)
@@ -396,59 +288,47 @@ class TestFindConflicts:
 
 # is_during_hours tests
 class TestIsDuringHours:
-    def test_within_hours(self, today):
-        dt = datetime.combine(today, time(10, 30))
-        assert is_during_hours(dt, 9, 17) is True
-
-    def test_at_start_boundary(self, today):
-        dt = datetime.combine(today, time(9, 0))
-        assert is_during_hours(dt, 9, 17) is True
-
-    def test_before_start(self, today):
-        dt = datetime.combine(today, time(8, 59))
-        assert is_during_hours(dt, 9, 17) is False
-
-    def test_at_end_boundary(self, today):
-        dt = datetime.combine(today, time(17, 0))
-        assert is_during_hours(dt, 9, 17) is False  # End is exclusive
-
-    def test_after_end(self, today):
-        dt = datetime.combine(today, time(18, 0))
-        assert is_during_hours(dt, 9, 17) is False
+    @pytest.mark.parametrize(
+        "at,expected",
+        [
+            pytest.param((10, 30), True, id="within_hours"),
+            pytest.param((9, 0), True, id="at_start_boundary"),
+            pytest.param((8, 59), False, id="before_start"),
+            pytest.param((17, 0), False, id="at_end_boundary"),  # End is exclusive
+            pytest.param((18, 0), False, id="after_end"),
+        ],
+    )
+    def test_is_during_hours(self, dt_at, at, expected):
+        dt = dt_at(*at)
+        assert is_during_hours(dt, 9, 17) is expected
 
 
 class TestDropRedundantOoo:
     """Tests for OOO filtering, including multi-day midnight-to-midnight events."""
 
-    def test_multiday_ooo_drops_same_calendar_events(self):
+    def test_multiday_ooo_drops_same_calendar_events(self, event_factory):
         """A multi-day OOO (midnight-to-midnight, not all_day) should drop
         same-calendar events on covered dates."""
-        ooo = Event(
-            title="Out of office",
-            start=datetime(2026, 2, 5, 0, 0),
-            end=datetime(2026, 2, 7, 0, 0),
-            location="",
+        ooo = event_factory(
+            "Out of office",
+            datetime(2026, 2, 5, 0, 0),
+            datetime(2026, 2, 7, 0, 0),
             calendar="Work",
-            all_day=False,
             source="google_calendar",
         )
-        standup = Event(
-            title="Backend Guild Standup",
-            start=datetime(2026, 2, 5, 13, 30),
-            end=datetime(2026, 2, 5, 13, 45),
-            location="",
+        standup = event_factory(
+            "Backend Guild Standup",
+            datetime(2026, 2, 5, 13, 30),
+            datetime(2026, 2, 5, 13, 45),
             calendar="Work",
-            all_day=False,
             source="google_calendar",
         )
         # Event on a day NOT covered by the OOO
-        monday_meeting = Event(
-            title="Monday Sync",
-            start=datetime(2026, 2, 4, 10, 0),
-            end=datetime(2026, 2, 4, 10, 30),
-            location="",
+        monday_meeting = event_factory(
+            "Monday Sync",
+            datetime(2026, 2, 4, 10, 0),
+            datetime(2026, 2, 4, 10, 30),
             calendar="Work",
-            all_day=False,
             source="google_calendar",
         )
 
@@ -459,24 +339,20 @@ class TestDropRedundantOoo:
         assert "Monday Sync" in titles
         assert "Out of office" in titles
 
-    def test_multiday_ooo_keeps_different_calendar_events(self):
+    def test_multiday_ooo_keeps_different_calendar_events(self, event_factory):
         """Events from a different calendar should not be dropped by OOO."""
-        ooo = Event(
-            title="Out of office",
-            start=datetime(2026, 2, 5, 0, 0),
-            end=datetime(2026, 2, 7, 0, 0),
-            location="",
+        ooo = event_factory(
+            "Out of office",
+            datetime(2026, 2, 5, 0, 0),
+            datetime(2026, 2, 7, 0, 0),
             calendar="Work",
-            all_day=False,
             source="google_calendar",
         )
-        personal = Event(
-            title="Dentist",
-            start=datetime(2026, 2, 5, 14, 0),
-            end=datetime(2026, 2, 5, 15, 0),
-            location="",
+        personal = event_factory(
+            "Dentist",
+            datetime(2026, 2, 5, 14, 0),
+            datetime(2026, 2, 5, 15, 0),
             calendar="Personal",
-            all_day=False,
             source="google_calendar",
         )
 
@@ -485,24 +361,21 @@ class TestDropRedundantOoo:
 
         assert "Dentist" in titles
 
-    def test_allday_ooo_still_works(self):
+    def test_allday_ooo_still_works(self, event_factory):
         """Traditional all_day=True OOO events still filter correctly."""
-        ooo = Event(
-            title="OOO vacation",
-            start=datetime(2026, 2, 5, 0, 0),
-            end=datetime(2026, 2, 6, 0, 0),
-            location="",
+        ooo = event_factory(
+            "OOO vacation",
+            datetime(2026, 2, 5, 0, 0),
+            datetime(2026, 2, 6, 0, 0),
             calendar="Work",
             all_day=True,
             source="google_calendar",
         )
-        meeting = Event(
-            title="Team Standup",
-            start=datetime(2026, 2, 5, 10, 0),
-            end=datetime(2026, 2, 5, 10, 30),
-            location="",
+        meeting = event_factory(
+            "Team Standup",
+            datetime(2026, 2, 5, 10, 0),
+            datetime(2026, 2, 5, 10, 30),
             calendar="Work",
-            all_day=False,
             source="google_calendar",
         )
 
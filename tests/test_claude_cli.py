@@ -0,0 +1,106 @@
+"""Tests for Claude CLI adapter."""
+
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from friday.adapters.claude_cli import ClaudeCLIService
+
+# Shared run results: tests only inspect the call arguments, never these
+_OK_RESULT = SimpleNamespace(stdout="Done\n", stderr="", returncode=0)
+_FAILED_RESULT = SimpleNamespace(stdout="", stderr="boom", returncode=1)
+
+
+@pytest.mark.subprocess_mock
+@pytest.mark.xdist_group(name="subprocess")
+@patch("friday.adapters.claude_cli.find_claude_binary", return_value="claude")
+@patch("friday.adapters.claude_cli.subprocess.run")
+class TestClaudeCLIService:
+    def test_generate_returns_stdout(self, mock_run, _):
+        mock_run.return_value = _OK_RESULT
+        service = ClaudeCLIService(cwd="/tmp/friday", timeout=30)
+
+        assert service.generate("Hello") == "Done\n"
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["claude", "-p", "Hello"]
+        assert str(kwargs["cwd"]) == "/tmp/friday"
+        assert kwargs["timeout"] == 30
+
+    def test_generate_nonzero_exit_raises(self, mock_run, _):
+        mock_run.return_value = _FAILED_RESULT
+
+        with pytest.raises(RuntimeError, match="boom"):
+            ClaudeCLIService().generate("Hello")
+
+    def test_generate_timeout_raises(self, mock_run, _):
+        mock_run.side_effect = subprocess.TimeoutExpired("claude", 30)
+
+        with pytest.raises(RuntimeError, match="timed out after 30s"):
+            ClaudeCLIService(timeout=30).generate("Hello")
+
+    def test_generate_missing_binary_raises(self, mock_run, _):
+        mock_run.side_effect = FileNotFoundError
+
+        with pytest.raises(RuntimeError, match="not found"):
+            ClaudeCLIService().generate("Hello")
+
+    def test_run_command_passes_command(self, mock_run, _):
+        mock_run.return_value = _OK_RESULT
+
+        assert ClaudeCLIService().run_command("/triage") == "Done\n"
+        assert mock_run.call_args.args[0] == ["claude", "-p", "/triage"]
+
+    def test_run_command_nonzero_exit_raises(self, mock_run, _):
+        mock_run.return_value = _FAILED_RESULT
+
+        with pytest.raises(RuntimeError, match="command failed: boom"):
+            ClaudeCLIService().run_command("/triage")
+
+
+@pytest.fixture
+def stub_claude(tmp_path):
+    """A stand-in claude binary that runs its -p argument as Python code."""
+    script = tmp_path / "claude"
+    script.write_text(f"#!{sys.executable}\nimport sys\nexec(sys.argv[2])\n")
+    script.chmod(0o755)
+    with patch("friday.adapters.claude_cli.find_claude_binary", return_value=str(script)):
+        yield
+
+
+@pytest.mark.usefixtures("stub_claude")
+class TestClaudeCLIServiceStream:
+    def test_yields_output_lines(self):
+        chunks = list(ClaudeCLIService(timeout=10).stream("print('one'); print('two')"))
+
+        assert chunks == ["one\n", "two\n"]
+
+    def test_nonzero_exit_raises_with_stderr(self):
+        # More stderr than a pipe buffer holds must not stall the child
+        code = "sys.stderr.write('x' * 200_000 + 'boom'); print('partial'); sys.exit(1)"
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(ClaudeCLIService(timeout=10).stream(code))
+
+    def test_stopping_early_kills_child(self):
+        procs = []
+        popen = subprocess.Popen
+
+        def spawn(*args, **kwargs):
+            procs.append(popen(*args, **kwargs))
+            return procs[-1]
+
+        code = "import time; print('first', flush=True); time.sleep(30)"
+        with patch("friday.adapters.claude_cli.subprocess.Popen", side_effect=spawn):
+            chunks = ClaudeCLIService(timeout=10).stream(code)
+            assert next(chunks) == "first\n"
+            chunks.close()
+
+        assert procs[0].poll() is not None
+
+    @pytest.mark.slow
+    def test_timeout_raises(self):
+        with pytest.raises(RuntimeError, match="timed out after 1s"):
+            list(ClaudeCLIService(timeout=1).stream("import time; time.sleep(30)"))
@@ -0,0 +1,181 @@
+"""Tests for configuration loading."""
+
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from friday.config import (
+    FRIDAY_HOME,
+    Config,
+    GcalAccount,
+    Tokens,
+    _parse_config,
+    journal_dir_for,
+    load_config,
+    reload_config,
+)
+
+from tests._consts import WORK_ACCOUNT_DIR, WORK_ACCOUNT_LINE
+
+
+class TestLoadConfigCache:
+    def test_missing_file_returns_defaults(self, tmp_path):
+        config = load_config(tmp_path / "missing.conf")
+
+        assert config == Config()
+
+    def test_reuses_parsed_config_while_file_unchanged(self, tmp_path):
+        config_file = tmp_path / "friday.conf"
+        config_file.write_text('TIMEZONE="Europe/London"')
+
+        with patch("friday.config._parse_config", wraps=_parse_config) as parse:
+            first = load_config(config_file)
+            second = load_config(config_file)
+
+        assert parse.call_count == 1
+        assert first == second
+        assert first.timezone == "Europe/London"
+
+    def test_returns_independent_copies(self, tmp_path):
+        config_file = tmp_path / "friday.conf"
+        config_file.write_text('PRIORITY_TASK_LISTS="Inbox"\n' + WORK_ACCOUNT_LINE)
+
+        first = load_config(config_file)
+        first.priority_task_lists.append("Work")
+        first.gcalcli_accounts[0].label = "Changed"
+        second = load_config(config_file)
+
+        assert second.priority_task_lists == ["Inbox"]
+        assert second.gcalcli_accounts == [GcalAccount(WORK_ACCOUNT_DIR, "Work")]
+
+    def test_picks_up_file_changes(self, tmp_path):
+        config_file = tmp_path / "friday.conf"
+        config_file.write_text('TIMEZONE="Europe/London"')
+
+        load_config(config_file)
+        config_file.write_text('TIMEZONE="America/Vancouver"')
+        config = load_config(config_file)
+
+        assert config.timezone == "America/Vancouver"
+
+    def test_explicit_path_source(self, tmp_path):
+        config_file = tmp_path / "other.conf"
+        config_file.write_text('TIMEZONE="Europe/London"')
+
+        assert load_config(config_file).timezone == "Europe/London"
+        assert load_config(str(config_file)) == load_config(config_file)
+
+    def test_stream_source_is_not_cached(self):
+        first = load_config(io.StringIO('TIMEZONE="Europe/London"'))
+        second = load_config(io.StringIO('TIMEZONE="Europe/London"'))
+
+        assert first is not second
+        assert first == second
+
+    def test_reload_config_bypasses_cache(self, tmp_path):
+        config_file = tmp_path / "friday.conf"
+        config_file.write_text('TIMEZONE="Europe/London"')
+
+        with (
+            patch("friday.config.CONFIG_FILE", config_file),
+            patch("friday.config._parse_config", wraps=_parse_config) as parse,
+        ):
+            first = load_config()
+            second = reload_config()
+
+        assert parse.call_count == 2
+        assert first == second
+
+
+_CONFIG_SAMPLES = {
+    "single_labeled": WORK_ACCOUNT_LINE,
+    "multi": 'GCALCLI_ACCOUNTS="~/.gcalcli/personal, ~/.gcalcli/work:Work"',
+    "json": (
+        'GCALCLI_ACCOUNTS=\'[{"config_folder": "~/.gcalcli/work", "label": "Work", '
+        '"calendars": ["Work", "Meetings"]}]\''
+    ),
+    "client_secret": 'GOOGLE_CLIENT_SECRET_FILE="~/secrets/client_secret.json"',
+}
+
+
+@pytest.fixture(scope="session")
+def parsed_configs():
+    """Each sample parsed once; tests only read the results."""
+    return {name: load_config(io.StringIO(body)) for name, body in _CONFIG_SAMPLES.items()}
+
+
+class TestGcalAccountConfig:
+    @pytest.mark.parametrize(
+        "name,attr,expected",
+        [
+            ("single_labeled", "gcalcli_accounts", [GcalAccount(WORK_ACCOUNT_DIR, "Work")]),
+            (
+                "multi",
+                "gcalcli_accounts",
+                [GcalAccount("~/.gcalcli/personal"), GcalAccount(WORK_ACCOUNT_DIR, "Work")],
+            ),
+            ("json", "gcalcli_accounts", [GcalAccount(WORK_ACCOUNT_DIR, "Work", ["Work", "Meetings"])]),
+            ("client_secret", "google_client_secret_file", "~/secrets/client_secret.json"),
+        ],
+    )
+    def test_parse(self, parsed_configs, name, attr, expected):
+        assert getattr(parsed_configs[name], attr) == expected
+
+
+class TestPriorityTaskLists:
+    def test_parses_comma_separated_lists(self, tmp_path):
+        config_file = tmp_path / "friday.conf"
+        config_file.write_text('PRIORITY_TASK_LISTS="Inbox, Work,,Personal"')
+
+        config = load_config(config_file)
+
+        assert config.priority_task_lists == ["Inbox", "Work", "Personal"]
+
+    def test_defaults_to_all_lists(self):
+        assert Config().priority_task_lists == []
+
+
+class TestJournalDirFor:
+    def test_uses_configured_dir(self, tmp_path):
+        assert journal_dir_for(Config(daily_journal_dir=str(tmp_path))) == tmp_path
+
+    def test_expands_user_path(self):
+        config = Config(daily_journal_dir="~/some/journal")
+        assert journal_dir_for(config) == Path.home() / "some" / "journal"
+
+    def test_falls_back_to_default(self):
+        assert journal_dir_for(Config()) == FRIDAY_HOME / "journal" / "daily"
+
+
+class TestTokens:
+    def test_missing_file_returns_empty_tokens(self, tmp_path):
+        with patch("friday.config.TOKEN_FILE", tmp_path / ".tokens.json"):
+            assert Tokens.load() == Tokens()
+
+    def test_round_trip(self, tmp_path):
+        with patch("friday.config.TOKEN_FILE", tmp_path / ".tokens.json"):
+            Tokens("access", "refresh", 123).save()
+            assert Tokens.load() == Tokens("access", "refresh", 123)
+
+    def test_load_returns_independent_objects(self, tmp_path):
+        with patch("friday.config.TOKEN_FILE", tmp_path / ".tokens.json"):
+            Tokens("access", "refresh", 123).save()
+            first = Tokens.load()
+            first.access_token = "changed"
+            assert Tokens.load().access_token == "access"
+
+    def test_save_skips_unchanged_tokens(self, tmp_path):
+        token_file = tmp_path / ".tokens.json"
+        with patch("friday.config.TOKEN_FILE", token_file):
+            Tokens("access", "refresh", 123).save()
+            tokens = Tokens.load()
+            token_file.unlink()
+
+            tokens.save()
+            assert not token_file.exists()
+
+            tokens.expires_at = 456
+            tokens.save()
+            assert Tokens.load().expires_at == 456
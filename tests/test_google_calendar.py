@@ -1,57 +1,118 @@
 """Tests for Google Calendar adapter."""
 
-from unittest.mock import patch, MagicMock
-from datetime import date, datetime
+import subprocess
+import sys
+from unittest.mock import patch
+from datetime import date
+from functools import lru_cache
 
 import pytest
 
-from friday.adapters.google_calendar import GoogleCalendarAdapter
-from friday.config import Config, GcalAccount, load_config
+from friday.adapters.google_calendar import GoogleCalendarAdapter, _parse_events
+from friday.config import Config, GcalAccount
 from friday.adapters.composite_calendar import CompositeCalendarAdapter
 
-
-class TestGoogleCalendarAdapter:
-    """Tests for GoogleCalendarAdapter."""
-
-    def test_label_from_config_folder(self):
-        adapter = GoogleCalendarAdapter(config_folder="/home/user/.config/work")
-        assert adapter.label == "work"
-
-    def test_explicit_label(self):
-        adapter = GoogleCalendarAdapter(
-            config_folder="/home/user/.config/work",
-            label="Work Calendar",
-        )
-        assert adapter.label == "Work Calendar"
-
-    def test_token_path(self):
-        adapter = GoogleCalendarAdapter(config_folder="/home/user/.config/work")
+from tests._consts import SCRATCH_CONFIG_DIR, WORK_CONFIG_DIR
+from tests._fakes import FakeGoogleService
+
+
+# API payloads shared by the adapter tests; treat as read-only
+_CALENDAR_LIST_ITEMS = (
+    {"summary": "Work", "id": "work@group.calendar.google.com"},
+    {"summary": "Personal", "id": "personal@gmail.com"},
+)
+_ACCESS_ROLE_ITEMS = (
+    {"accessRole": "owner", "summary": "andrew@gmail.com"},
+    {"accessRole": "reader", "summary": "Holidays"},
+)
+_TIMED_EVENT_ITEMS = (
+    {
+        "summary": "Standup",
+        "start": {"dateTime": "2025-01-15T10:00:00-05:00"},
+        "end": {"dateTime": "2025-01-15T10:30:00-05:00"},
+        "location": "Room A",
+    },
+)
+_ALL_DAY_EVENT_ITEMS = (
+    {
+        "summary": "Holiday",
+        "start": {"date": "2025-01-15"},
+        "end": {"date": "2025-01-16"},
+    },
+)
+_RSVP_EVENT_ITEMS = (
+    {
+        "summary": "Accepted Meeting",
+        "start": {"dateTime": "2025-01-15T10:00:00-05:00"},
+        "end": {"dateTime": "2025-01-15T10:30:00-05:00"},
+        "attendees": [
+            {"email": "me@example.com", "self": True, "responseStatus": "accepted"},
+        ],
+    },
+    {
+        "summary": "Declined Meeting",
+        "start": {"dateTime": "2025-01-15T11:00:00-05:00"},
+        "end": {"dateTime": "2025-01-15T11:30:00-05:00"},
+        "attendees": [
+            {"email": "me@example.com", "self": True, "responseStatus": "declined"},
+        ],
+    },
+    {
+        "summary": "No Attendees Event",
+        "start": {"dateTime": "2025-01-15T12:00:00-05:00"},
+        "end": {"dateTime": "2025-01-15T12:30:00-05:00"},
+    },
+)
+
+
+@pytest.fixture(scope="module")
+def adapter_factory():
+    """Construct adapters once per distinct set of constructor arguments.
+
+    Adapters keep no per-call state, so tests can share instances. List
+    arguments such as calendars must be passed as tuples to be hashable.
+    """
+    @lru_cache(maxsize=None)
+    def make(cls=GoogleCalendarAdapter, **kwargs):
+        return cls(**kwargs)
+    return make
+
+
+class TestGoogleCalendarAdapterSetup:
+    """Constructor-only tests; nothing here talks to the API."""
+
+    @pytest.mark.parametrize(
+        "kwargs,expected_label",
+        [
+            pytest.param({}, "work", id="from_config_folder"),
+            pytest.param({"label": "Work Calendar"}, "Work Calendar", id="explicit"),
+            pytest.param({"label": ""}, "work", id="empty_falls_back_to_folder"),
+        ],
+    )
+    def test_label(self, adapter_factory, kwargs, expected_label):
+        adapter = adapter_factory(config_folder=WORK_CONFIG_DIR, **kwargs)
+        assert adapter.label == expected_label
+
+    def test_token_path(self, adapter_factory):
+        adapter = adapter_factory(config_folder=WORK_CONFIG_DIR)
         assert adapter._token_path.name == "token.json"
         assert "work" in str(adapter._token_path)
 
-    @patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
-    def test_fetch_day_returns_timed_events(self, mock_build):
-        service = MagicMock()
-        mock_build.return_value = service
 
-        service.calendarList().list().execute.return_value = {
-            "items": [{"summary": "Work", "id": "work@group.calendar.google.com"}]
-        }
-        service.events().list().execute.return_value = {
-            "items": [
-                {
-                    "summary": "Standup",
-                    "start": {"dateTime": "2025-01-15T10:00:00-05:00"},
-                    "end": {"dateTime": "2025-01-15T10:30:00-05:00"},
-                    "location": "Room A",
-                },
-            ]
-        }
+@pytest.mark.google_service
+@pytest.mark.xdist_group(name="google_service")
+@patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
+class TestGoogleCalendarAdapter:
+    """Tests for GoogleCalendarAdapter API calls."""
+
+    def test_fetch_day_returns_timed_events(self, mock_build, adapter_factory):
+        service = FakeGoogleService(calendars=_CALENDAR_LIST_ITEMS, events=_TIMED_EVENT_ITEMS)
+        mock_build.return_value = service
 
-        adapter = GoogleCalendarAdapter(
-            config_folder="/tmp/test",
+        adapter = adapter_factory(
+            config_folder=SCRATCH_CONFIG_DIR,
             label="Work",
-            calendars=["Work"],
+            calendars=("Work",),
         )
         events = adapter.fetch_day(date(2025, 1, 15))
 
@@ -61,95 +122,24 @@ class TestGoogleCalendarAdapter:
         assert events[0].location == "Room A"
         assert events[0].all_day is False
         assert events[0].source == "google_calendar"
+        assert [q["calendarId"] for q in service.event_queries] == ["work@group.calendar.google.com"]
 
-    @patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
-    def test_fetch_day_returns_all_day_events(self, mock_build):
-        service = MagicMock()
-        mock_build.return_value = service
-
-        service.calendarList().list().execute.return_value = {"items": []}
-        service.events().list().execute.return_value = {
-            "items": [
-                {
-                    "summary": "Holiday",
-                    "start": {"date": "2025-01-15"},
-                    "end": {"date": "2025-01-16"},
-                },
-            ]
-        }
-
-        adapter = GoogleCalendarAdapter(config_folder="/tmp/test", label="Personal")
-        events = adapter.fetch_day(date(2025, 1, 15))
-
-        assert len(events) == 1
-        assert events[0].all_day is True
-        assert events[0].title == "Holiday"
-
-    @patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
-    def test_fetch_day_excludes_declined_events(self, mock_build):
-        service = MagicMock()
-        mock_build.return_value = service
-
-        service.calendarList().list().execute.return_value = {"items": []}
-        service.events().list().execute.return_value = {
-            "items": [
-                {
-                    "summary": "Accepted Meeting",
-                    "start": {"dateTime": "2025-01-15T10:00:00-05:00"},
-                    "end": {"dateTime": "2025-01-15T10:30:00-05:00"},
-                    "attendees": [
-                        {"email": "me@example.com", "self": True, "responseStatus": "accepted"},
-                    ],
-                },
-                {
-                    "summary": "Declined Meeting",
-                    "start": {"dateTime": "2025-01-15T11:00:00-05:00"},
-                    "end": {"dateTime": "2025-01-15T11:30:00-05:00"},
-                    "attendees": [
-                        {"email": "me@example.com", "self": True, "responseStatus": "declined"},
-                    ],
-                },
-                {
-                    "summary": "No Attendees Event",
-                    "start": {"dateTime": "2025-01-15T12:00:00-05:00"},
-                    "end": {"dateTime": "2025-01-15T12:30:00-05:00"},
-                },
-            ]
-        }
-
-        adapter = GoogleCalendarAdapter(config_folder="/tmp/test", label="Work")
-        events = adapter.fetch_day(date(2025, 1, 15))
-
-        assert len(events) == 2
-        assert events[0].title == "Accepted Meeting"
-        assert events[1].title == "No Attendees Event"
-
-    @patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
-    def test_fetch_day_api_error_returns_empty(self, mock_build):
+    def test_fetch_day_api_error_returns_empty(self, mock_build, adapter_factory):
         mock_build.side_effect = Exception("API error")
-        adapter = GoogleCalendarAdapter(config_folder="/tmp/test")
+        adapter = adapter_factory(config_folder=SCRATCH_CONFIG_DIR)
         events = adapter.fetch_day(date(2025, 1, 15))
         assert events == []
 
-    @patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
-    def test_fetch_day_no_credentials_returns_empty(self, mock_build):
+    def test_fetch_day_no_credentials_returns_empty(self, mock_build, adapter_factory):
         mock_build.return_value = None
-        adapter = GoogleCalendarAdapter(config_folder="/tmp/test")
+        adapter = adapter_factory(config_folder=SCRATCH_CONFIG_DIR)
         events = adapter.fetch_day(date(2025, 1, 15))
         assert events == []
 
-    @patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
-    def test_list_calendars(self, mock_build):
-        service = MagicMock()
-        mock_build.return_value = service
-        service.calendarList().list().execute.return_value = {
-            "items": [
-                {"accessRole": "owner", "summary": "andrew@gmail.com"},
-                {"accessRole": "reader", "summary": "Holidays"},
-            ]
-        }
+    def test_list_calendars(self, mock_build, adapter_factory):
+        mock_build.return_value = FakeGoogleService(calendars=_ACCESS_ROLE_ITEMS)
 
-        adapter = GoogleCalendarAdapter(config_folder="/tmp/test")
+        adapter = adapter_factory(config_folder=SCRATCH_CONFIG_DIR)
         result = adapter.list_calendars()
 
         assert result == [
@@ -157,66 +147,40 @@ class TestGoogleCalendarAdapter:
             ("reader", "Holidays"),
         ]
 
-    @patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
-    def test_resolve_calendar_ids_filters_by_name(self, mock_build):
-        service = MagicMock()
-        mock_build.return_value = service
-        service.calendarList().list().execute.return_value = {
-            "items": [
-                {"summary": "Work", "id": "work@group.calendar.google.com"},
-                {"summary": "Personal", "id": "personal@gmail.com"},
-            ]
-        }
+    def test_resolve_calendar_ids_filters_by_name(self, mock_build, adapter_factory):
+        service = FakeGoogleService(calendars=_CALENDAR_LIST_ITEMS)
 
-        adapter = GoogleCalendarAdapter(
-            config_folder="/tmp/test",
-            calendars=["Work"],
+        adapter = adapter_factory(
+            config_folder=SCRATCH_CONFIG_DIR,
+            calendars=("Work",),
         )
         ids = adapter._resolve_calendar_ids(service)
         assert ids == ["work@group.calendar.google.com"]
 
-    @patch("friday.adapters.google_calendar.GoogleCalendarAdapter._build_service")
-    def test_resolve_calendar_ids_no_filter_returns_primary(self, mock_build):
-        service = MagicMock()
-        adapter = GoogleCalendarAdapter(config_folder="/tmp/test")
+    def test_resolve_calendar_ids_no_filter_returns_primary(self, mock_build, adapter_factory):
+        service = FakeGoogleService()
+        adapter = adapter_factory(config_folder=SCRATCH_CONFIG_DIR)
         ids = adapter._resolve_calendar_ids(service)
         assert ids == ["primary"]
 
 
-class TestGcalAccountConfig:
-    """Tests for GcalAccount config parsing (unchanged)."""
-
-    def test_parse_single_account_with_label(self, tmp_path):
-        config_file = tmp_path / "friday.conf"
-        config_file.write_text('GCALCLI_ACCOUNTS="~/.gcalcli/work:Work"')
+class TestParseEvents:
+    def test_all_day_events(self):
+        events = _parse_events(_ALL_DAY_EVENT_ITEMS, "Personal", "America/Toronto")
 
-        with patch("friday.config.CONFIG_FILE", config_file):
-            config = load_config()
-
-        assert len(config.gcalcli_accounts) == 1
-        assert config.gcalcli_accounts[0].config_folder == "~/.gcalcli/work"
-        assert config.gcalcli_accounts[0].label == "Work"
-
-    def test_parse_json_format_with_calendars(self, tmp_path):
-        config_file = tmp_path / "friday.conf"
-        config_file.write_text(
-            'GCALCLI_ACCOUNTS=\'[{"config_folder": "~/.gcalcli/work", "label": "Work", "calendars": ["Work", "Meetings"]}]\''
-        )
-
-        with patch("friday.config.CONFIG_FILE", config_file):
-            config = load_config()
-
-        assert len(config.gcalcli_accounts) == 1
-        assert config.gcalcli_accounts[0].calendars == ["Work", "Meetings"]
+        assert len(events) == 1
+        assert events[0].all_day is True
+        assert events[0].title == "Holiday"
+        assert events[0].calendar == "Personal"
+        assert events[0].start.tzinfo is not None
 
-    def test_parse_google_client_secret_file(self, tmp_path):
-        config_file = tmp_path / "friday.conf"
-        config_file.write_text('GOOGLE_CLIENT_SECRET_FILE="~/secrets/client_secret.json"')
+    def test_excludes_declined_events(self):
+        events = _parse_events(_RSVP_EVENT_ITEMS, "Work", "America/Toronto")
 
-        with patch("friday.config.CONFIG_FILE", config_file):
-            config = load_config()
+        assert [e.title for e in events] == ["Accepted Meeting", "No Attendees Event"]
 
-        assert config.google_client_secret_file == "~/secrets/client_secret.json"
+    def test_skips_items_without_start(self):
+        assert _parse_events([{"summary": "Broken"}], "Work", "America/Toronto") == []
 
 
 class TestCompositeCalendarMultiAccount:
@@ -267,3 +231,18 @@ class TestCompositeCalendarMultiAccount:
         adapter = CompositeCalendarAdapter(config)
         assert adapter._adapters[0].client_secret_file == "~/secret.json"
         assert adapter._adapters[0].timezone == "US/Eastern"
+
+
+@pytest.mark.slow
+def test_import_does_not_load_google_client_libraries():
+    """The Google client libraries are slow to import, so the adapter defers
+    them until an API call. Check in a fresh interpreter, since this test
+    process may already have imported them."""
+    code = (
+        "import sys, friday.adapters.google_calendar\n"
+        "heavy = [m for m in ('googleapiclient', 'google.auth', 'google.oauth2', "
+        "'google_auth_oauthlib') if m in sys.modules]\n"
+        "print(','.join(heavy))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
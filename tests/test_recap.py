@@ -1,17 +1,10 @@
 """Tests for core recap logic."""
 
-from datetime import date
-
 import pytest
 
 from friday.core.recap import Recap, RecapMode, determine_recap_mode
 
 
-@pytest.fixture
-def today():
-    return date(2025, 1, 15)
-
-
 class TestRecap:
     def test_to_markdown_full(self, today):
         """Test serialization with all fields."""
@@ -105,6 +98,29 @@ class TestRecap:
         with pytest.raises(ValueError, match="incomplete frontmatter"):
             Recap.from_markdown("---\ndate: 2025-01-15")
 
+    def test_from_markdown_dashes_inside_values(self, today):
+        """Only a whole '---' line closes the frontmatter."""
+        original = Recap(
+            date=today,
+            mode=RecapMode.FULL,
+            wins=["Shipped v2 --- finally"],
+            reflection="Before\n\n---\n\nAfter a rule",
+        )
+
+        parsed = Recap.from_markdown(original.to_markdown())
+
+        assert parsed.wins == ["Shipped v2 --- finally"]
+        assert parsed.reflection == "Before\n\n---\n\nAfter a rule"
+
+    def test_from_markdown_returns_independent_recaps(self, today):
+        """Parses are cached, but each call gets its own lists."""
+        md = Recap(date=today, mode=RecapMode.FULL, wins=["Win"]).to_markdown()
+
+        first = Recap.from_markdown(md)
+        first.wins.append("Mutated")
+
+        assert Recap.from_markdown(md).wins == ["Win"]
+
     def test_from_markdown_defaults(self, today):
         """Test that missing fields get defaults."""
         md = f"""---
@@ -190,6 +206,11 @@ class TestRecapModeEnum:
         assert RecapMode.TASKS_ONLY.value == "tasks_only"
         assert RecapMode.FREEFORM.value == "freeform"
 
+    def test_mode_is_plain_string(self):
+        """RecapMode members compare and format as their string values."""
+        assert RecapMode.FULL == "full"
+        assert f"{RecapMode.TASKS_ONLY}" == "tasks_only"
+
     def test_mode_from_value(self):
         """Test creating RecapMode from string value."""
         assert RecapMode("full") == RecapMode.FULL
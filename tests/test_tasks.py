@@ -8,22 +8,24 @@ from friday.core.tasks import (
     Task,
     filter_actionable,
     categorize_tasks,
+    classify_tasks,
+    filter_notes,
     sort_by_priority,
     filter_overdue,
     filter_by_project,
 )
 
-
-# Fixtures
-@pytest.fixture
-def today():
-    return date(2025, 1, 15)
+pytestmark = pytest.mark.parallel
 
 
-@pytest.fixture
+# Fixtures
+@pytest.fixture(scope="module")
 def sample_tasks(today):
-    """Sample tasks covering various scenarios."""
-    return [
+    """Sample tasks covering various scenarios.
+
+    Shared across the module; a tuple of frozen tasks, so tests can't alter it.
+    """
+    return (
         Task(
             id="1",
             title="Urgent important task",
@@ -72,7 +74,7 @@ def sample_tasks(today):
             project_id="p3",
             project_name="Side Project",
         ),
-    ]
+    )
 
 
 # Task class tests
@@ -172,42 +174,20 @@ class TestTask:
 
 # Filter function tests
 class TestFilterActionable:
-    def test_includes_q1_tasks(self, sample_tasks, today):
-        """Q1 (urgent + important) tasks should be included."""
-        actionable = filter_actionable(sample_tasks, urgent_days=3, as_of=today)
-        q1_task = next(t for t in sample_tasks if t.id == "1")
-        assert q1_task in actionable
-
-    def test_includes_urgent_tasks(self, sample_tasks, today):
-        """Urgent tasks (even if not important) should be included."""
-        actionable = filter_actionable(sample_tasks, urgent_days=3, as_of=today)
-        urgent_task = next(t for t in sample_tasks if t.id == "3")
-        assert urgent_task in actionable
-
-    def test_includes_overdue_tasks(self, sample_tasks, today):
-        """Overdue tasks should be included."""
-        actionable = filter_actionable(sample_tasks, urgent_days=3, as_of=today)
-        overdue_task = next(t for t in sample_tasks if t.id == "5")
-        assert overdue_task in actionable
-
-    def test_excludes_non_urgent_non_q1(self, sample_tasks, today):
-        """Tasks that are neither urgent nor Q1 should be excluded."""
-        actionable = filter_actionable(sample_tasks, urgent_days=3, as_of=today)
-        q2_task = next(t for t in sample_tasks if t.id == "2")
-        q4_task = next(t for t in sample_tasks if t.id == "4")
-        assert q2_task not in actionable
-        assert q4_task not in actionable
-
-    def test_respects_urgent_days_parameter(self, sample_tasks, today):
-        """urgent_days parameter should control the urgency window."""
-        # With 1 day window, task due in 2 days is not urgent
-        actionable_1day = filter_actionable(sample_tasks, urgent_days=1, as_of=today)
-        due_in_2_task = next(t for t in sample_tasks if t.id == "6")
-        assert due_in_2_task not in actionable_1day
-
-        # With 3 day window, task due in 2 days is urgent
-        actionable_3day = filter_actionable(sample_tasks, urgent_days=3, as_of=today)
-        assert due_in_2_task in actionable_3day
+    @pytest.mark.parametrize(
+        "urgent_days,expected_ids",
+        [
+            # Q1, urgent-only and overdue tasks; task 6 (due in 2 days) is outside the window
+            (1, {"1", "3", "5"}),
+            (3, {"1", "3", "5", "6"}),
+            # Undated tasks are never actionable
+            (10, {"1", "2", "3", "5", "6"}),
+        ],
+    )
+    def test_urgency_window(self, sample_tasks, today, urgent_days, expected_ids):
+        """urgent_days controls which dated tasks count as actionable."""
+        actionable = filter_actionable(sample_tasks, urgent_days=urgent_days, as_of=today)
+        assert {t.id for t in actionable} == expected_ids
 
 
 class TestCategorizeTasks:
@@ -251,6 +231,51 @@ class TestCategorizeTasks:
         assert len(personal) == 0
         assert len(other) == len(sample_tasks)
 
+    def test_project_in_both_lists_lands_in_both(self, sample_tasks):
+        work, personal, other = categorize_tasks(
+            sample_tasks,
+            work_lists=["Work"],
+            personal_lists=["Work", "Personal"],
+        )
+        assert {t.id for t in work} == {"1", "2", "5"}
+        assert {t.id for t in personal} == {"1", "2", "3", "4", "5"}
+        assert {t.id for t in other} == {"6"}
+
+
+class TestClassifyTasks:
+    @pytest.fixture
+    def tasks_with_notes(self, sample_tasks, today):
+        return (
+            *sample_tasks,
+            Task(id="7", title="Note soon", priority=0, due_date=today + timedelta(days=1),
+                 project_id="p1", project_name="Work", kind="NOTE"),
+            Task(id="8", title="Note later", priority=0, due_date=today + timedelta(days=9),
+                 project_id="p1", project_name="Work", kind="NOTE"),
+            Task(id="9", title="Undated note", priority=0, due_date=None,
+                 project_id="p1", project_name="Work", kind="NOTE"),
+        )
+
+    @pytest.mark.parametrize(
+        "personal_lists",
+        [["Personal"], ["Work", "Personal"]],
+        ids=["disjoint", "overlapping"],
+    )
+    def test_matches_separate_filters(self, tasks_with_notes, today, personal_lists):
+        buckets = classify_tasks(tasks_with_notes, ["Work"], personal_lists, as_of=today)
+
+        actionable = filter_actionable(tasks_with_notes, as_of=today)
+        work, personal, other = categorize_tasks(actionable, ["Work"], personal_lists)
+        assert buckets.work == work
+        assert buckets.personal == personal
+        assert buckets.other == other
+        assert buckets.notes == filter_notes(tasks_with_notes, as_of=today)
+
+    def test_notes_never_land_in_task_buckets(self, tasks_with_notes, today):
+        buckets = classify_tasks(tasks_with_notes, ["Work"], ["Personal"], as_of=today)
+
+        assert [t.title for t in buckets.notes] == ["Note soon"]
+        assert not any(t.is_note for t in buckets.work + buckets.personal + buckets.other)
+
 
 class TestSortByPriority:
     def test_sorts_by_priority_descending(self, today):
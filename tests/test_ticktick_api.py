@@ -0,0 +1,38 @@
+"""Tests for TickTick API adapter."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from friday.adapters.ticktick_api import TickTickAdapter
+from friday.config import Config, Tokens
+
+
+class TestEnsureValidToken:
+    def test_concurrent_refresh_happens_once(self, tmp_path):
+        """Two adapters racing on an expiring token share one refresh."""
+        barrier = threading.Barrier(2)
+
+        def fake_refresh(adapter):
+            time.sleep(0.1)  # Hold the lock so the other thread queues on it
+            adapter.tokens = Tokens("new-access", "new-refresh", int(time.time()) + 3600)
+            adapter.tokens.save()
+
+        def ensure(adapter):
+            barrier.wait()
+            adapter._ensure_valid_token()
+
+        with (
+            patch("friday.config.TOKEN_FILE", tmp_path / ".tokens.json"),
+            patch.object(TickTickAdapter, "_refresh_token", autospec=True, side_effect=fake_refresh) as refresh,
+        ):
+            Tokens("old-access", "old-refresh", int(time.time()) + 60).save()
+            adapters = [TickTickAdapter(Config()), TickTickAdapter(Config())]
+            threads = [threading.Thread(target=ensure, args=(a,)) for a in adapters]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=5)
+
+        assert refresh.call_count == 1
+        assert [a.tokens.access_token for a in adapters] == ["new-access", "new-access"]
@@ -1,13 +1,18 @@
 """Tests for the shared workflow layer."""
 
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from friday.config import Config, FRIDAY_HOME
+from friday.core.tasks import Task
+from friday.ticktick import AuthenticationError
 from friday.workflows import (
+    _render_template,
+    compile_recap_prompt,
+    compile_review,
     get_journal,
     generate_briefing,
     generate_weekly_plan,
@@ -54,7 +59,7 @@ class TestGenerateBriefing:
 
         result = generate_briefing(config)
 
-        mock_compile.assert_called_once()
+        mock_compile.assert_called_once_with(config, date.today())
         mock_instance.generate.assert_called_once_with("the prompt")
         assert result == "briefing output"
 
@@ -97,6 +102,49 @@ class TestGenerateBriefing:
         with pytest.raises(RuntimeError, match="Claude CLI not found"):
             generate_briefing(config)
 
+    @patch("friday.workflows.compile_briefing")
+    @patch("friday.workflows.ClaudeCLIService")
+    def test_streams_chunks_when_callback_given(self, mock_cls, mock_compile, config, tmp_path):
+        mock_compile.return_value = "prompt"
+        mock_instance = MagicMock()
+        mock_instance.stream.return_value = iter(["# Briefing\n", "\n", "Do the thing\n"])
+        mock_cls.return_value = mock_instance
+        chunks = []
+
+        result = generate_briefing(config, on_chunk=chunks.append)
+
+        mock_instance.stream.assert_called_once_with("prompt")
+        mock_instance.generate.assert_not_called()
+        assert chunks == ["# Briefing\n", "\n", "Do the thing\n"]
+        assert result == "# Briefing\n\nDo the thing"
+        journal_file = tmp_path / f"{date.today().isoformat()}.md"
+        assert "Do the thing" in journal_file.read_text()
+
+    @patch("friday.workflows.compile_briefing")
+    @patch("friday.workflows.ClaudeCLIService")
+    def test_as_of_sets_compile_date_and_journal_entry(self, mock_cls, mock_compile, config, tmp_path):
+        mock_compile.return_value = "prompt"
+        mock_cls.return_value.generate.return_value = "backfilled"
+        as_of = date(2025, 1, 15)
+
+        generate_briefing(config, as_of=as_of)
+
+        mock_compile.assert_called_once_with(config, as_of)
+        assert "backfilled" in (tmp_path / "2025-01-15.md").read_text()
+
+    @patch("friday.workflows.compile_briefing")
+    @patch("friday.workflows.ClaudeCLIService")
+    def test_saves_to_given_journal(self, mock_cls, mock_compile, config, tmp_path):
+        mock_compile.return_value = "prompt"
+        mock_cls.return_value.generate.return_value = "briefing output"
+        journal = MagicMock()
+        as_of = date(2025, 1, 15)
+
+        generate_briefing(config, as_of=as_of, journal=journal)
+
+        journal.append.assert_called_once_with(as_of, "Morning Briefing", "briefing output")
+        assert not (tmp_path / "2025-01-15.md").exists()
+
 
 class TestGenerateWeeklyPlan:
     @patch("friday.workflows.compile_week")
@@ -136,3 +184,116 @@ class TestGenerateWeeklyReview:
         content = (tmp_path / f"{today}.md").read_text()
         assert "## Weekly Review" in content
         assert "weekly review output" in content
+
+
+class TestCompileReview:
+    @patch("friday.workflows.cal.fetch_week", return_value=[])
+    @patch("friday.workflows.TickTickClient", side_effect=AuthenticationError)
+    def test_includes_only_last_weeks_journals(self, mock_client, mock_week, config, tmp_path):
+        today = date.today()
+        (tmp_path / f"{today.isoformat()}.md").write_text("today entry")
+        (tmp_path / f"{(today - timedelta(days=3)).isoformat()}.md").write_text("recent entry")
+        (tmp_path / f"{(today - timedelta(days=10)).isoformat()}.md").write_text("old entry")
+        (tmp_path / "notes.md").write_text("not a journal")
+
+        with patch("friday.workflows.FRIDAY_HOME", tmp_path):
+            prompt = compile_review(config, today)
+
+        assert "today entry" in prompt
+        assert "recent entry" in prompt
+        assert "old entry" not in prompt
+        assert "not a journal" not in prompt
+        assert prompt.index("recent entry") < prompt.index("today entry")
+
+    @patch("friday.workflows.cal.fetch_week", return_value=[])
+    @patch("friday.workflows.TickTickClient", side_effect=AuthenticationError)
+    def test_missing_journal_dir(self, mock_client, mock_week, tmp_path):
+        config = Config(daily_journal_dir=str(tmp_path / "missing"))
+
+        with patch("friday.workflows.FRIDAY_HOME", tmp_path):
+            prompt = compile_review(config)
+
+        assert "No journal entries this week." in prompt
+
+    @patch("friday.workflows.cal.fetch_week", return_value=[])
+    @patch("friday.workflows.TickTickClient")
+    def test_overdue_tasks_come_from_every_project(self, mock_client, mock_week, config, tmp_path):
+        today = date(2025, 1, 15)
+        client = mock_client.return_value
+        client.get_all_tasks.return_value = [
+            Task(id="1", title="Slipped task", priority=1, due_date=today - timedelta(days=2), project_id="p9"),
+            Task(id="2", title="Upcoming task", priority=5, due_date=today + timedelta(days=1), project_id="p1"),
+            Task(id="3", title="Old note", priority=0, due_date=today - timedelta(days=1), project_id="p1", kind="NOTE"),
+        ]
+        client.get_inbox_tasks.return_value = []
+
+        with patch("friday.workflows.FRIDAY_HOME", tmp_path):
+            prompt = compile_review(config, today)
+
+        client.get_priority_tasks.assert_not_called()
+        assert "Slipped task (due: 2025-01-13)" in prompt
+        assert "Upcoming task" not in prompt
+        assert "Old note" not in prompt
+
+
+class TestRenderTemplate:
+    def test_missing_template_returns_none(self, tmp_path):
+        assert _render_template(tmp_path / "missing.md", {}) is None
+
+    def test_fills_placeholders(self, tmp_path):
+        template = tmp_path / "t.md"
+        template.write_text("# {{DATE}}\n{{TASKS}}\n{{DATE}}")
+
+        result = _render_template(template, {"DATE": "2025-01-15", "TASKS": "- a"})
+
+        assert result == "# 2025-01-15\n- a\n2025-01-15"
+
+    def test_template_without_placeholders(self, tmp_path):
+        template = tmp_path / "t.md"
+        template.write_text("static prompt")
+
+        assert _render_template(template, {"DATE": "today"}) == "static prompt"
+
+    def test_leaves_unknown_placeholders(self, tmp_path):
+        template = tmp_path / "t.md"
+        template.write_text("{{DATE}} {{UNKNOWN}}")
+
+        assert _render_template(template, {"DATE": "today"}) == "today {{UNKNOWN}}"
+
+    def test_values_are_not_substituted_again(self, tmp_path):
+        template = tmp_path / "t.md"
+        template.write_text("{{TASKS}}")
+
+        result = _render_template(template, {"TASKS": "{{DATE}}", "DATE": "today"})
+
+        assert result == "{{DATE}}"
+
+    def test_picks_up_template_edits(self, tmp_path):
+        template = tmp_path / "t.md"
+        template.write_text("one {{DATE}}")
+        _render_template(template, {"DATE": "x"})
+        template.write_text("two {{DATE}}!")
+
+        assert _render_template(template, {"DATE": "x"}) == "two x!"
+
+
+class TestCompileRecapPrompt:
+    @patch("friday.workflows.TickTickClient", side_effect=AuthenticationError)
+    def test_truncates_long_morning_plan(self, mock_client, config, tmp_path):
+        target = date(2025, 1, 15)
+        (tmp_path / "2025-01-15.md").write_text("x" * 5000)
+
+        prompt = compile_recap_prompt(target, config, tmp_path)
+
+        assert "## This Morning's Plan\n\n" + "x" * 2000 + "\n\n[... truncated ...]" in prompt
+        assert "x" * 2001 not in prompt
+
+    @patch("friday.workflows.TickTickClient", side_effect=AuthenticationError)
+    def test_short_morning_plan_kept_whole(self, mock_client, config, tmp_path):
+        target = date(2025, 1, 15)
+        (tmp_path / "2025-01-15.md").write_text("## Morning Briefing\n\nShip it")
+
+        prompt = compile_recap_prompt(target, config, tmp_path)
+
+        assert "## Morning Briefing\n\nShip it" in prompt
+        assert "[... truncated ...]" not in prompt